@@ -9,7 +9,6 @@ from homeassistant.helpers.entity_registry import RegistryEntryDisabler, Registr
 from datetime import timedelta
 
 from .const import (
-    DOMAIN,
     PLATFORMS,
     CONF_POLL_INTERVAL_MINUTES,
     DEFAULT_POLL_INTERVAL_MINUTES,
@@ -17,15 +16,18 @@ from .const import (
 from .coordinator import FelshareCoordinator
 from .hub import FelshareHub
 from .hvac_sync import FelshareHvacSyncController
+from .models import FelshareRuntimeData
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hub = FelshareHub(hass, entry)
     poll_minutes = entry.options.get(CONF_POLL_INTERVAL_MINUTES, DEFAULT_POLL_INTERVAL_MINUTES)
-    try:
-        poll_minutes = int(poll_minutes)
-    except Exception:
-        poll_minutes = DEFAULT_POLL_INTERVAL_MINUTES
+    if not isinstance(poll_minutes, int):
+        # The options flow stores an int; only legacy/hand-edited values need coercion
+        try:
+            poll_minutes = int(poll_minutes)
+        except (TypeError, ValueError):
+            poll_minutes = DEFAULT_POLL_INTERVAL_MINUTES
 
     poll_interval = None if poll_minutes <= 0 else timedelta(minutes=poll_minutes)
     coordinator = FelshareCoordinator(hass, hub, poll_interval)
@@ -36,52 +38,58 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hvac_sync = FelshareHvacSyncController(hass, entry, coordinator)
     await hvac_sync.async_start()
 
-    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {
-        "hub": hub,
-        "coordinator": coordinator,
-        "hvac_sync": hvac_sync,
-    }
+    entry.runtime_data = FelshareRuntimeData(hub, coordinator, hvac_sync)
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    # Registry clean-up doesn't affect the entities just added; run it off the setup path.
+    entry.async_create_background_task(
+        hass,
+        _async_migrate_registry(hass, entry, coordinator.data.device_id),
+        "felshare_cloud registry migration",
+    )
+
+    return True
+
+
+async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    runtime: FelshareRuntimeData = entry.runtime_data
+    await runtime.hvac_sync.async_stop()
+    await runtime.coordinator.async_stop()
+    return unload_ok
+
+
+async def _async_migrate_registry(hass: HomeAssistant, entry: ConfigEntry, dev_id: str) -> None:
+    """Clean up registry entries left behind by older versions of the integration."""
     # UI polish: older versions stored many entities as EntityCategory.CONFIG in the entity registry.
     # That makes the device page show almost everything under "Configuration". We clear only those
     # sticky registry values so entities fall back to normal Controls/Sensors grouping.
     ent_reg = er.async_get(hass)
-    # Cache device_id for migration checks
-    dev_id = coordinator.data.device_id
-    for ent in list(ent_reg.entities.values()):
-        if ent.config_entry_id != entry.entry_id:
-            continue
-        if ent.platform != DOMAIN:
-            continue
+
+    # Deprecation: HVAC Sync now reuses Work schedule, so we disable legacy HVAC Sync
+    # day/time entities to reduce duplicates and confusion.
+    legacy_prefix = f"{entry.entry_id}_{dev_id}_hvac_sync_day_"
+    legacy_exact = frozenset(
+        {
+            f"{entry.entry_id}_{dev_id}_hvac_sync_start",
+            f"{entry.entry_id}_{dev_id}_hvac_sync_end",
+        }
+    )
+
+    # Only this entry's entities (all created by this integration).
+    for ent in er.async_entries_for_config_entry(ent_reg, entry.entry_id):
         if ent.entity_category == EntityCategory.CONFIG:
             ent_reg.async_update_entity(ent.entity_id, entity_category=None)
 
-        # Deprecation: HVAC Sync now reuses Work schedule, so we disable legacy HVAC Sync
-        # day/time entities to reduce duplicates and confusion.
         uid = ent.unique_id or ""
-        legacy_prefix = f"{entry.entry_id}_{dev_id}_hvac_sync_day_"
-        if uid.startswith(legacy_prefix) or uid in (
-            f"{entry.entry_id}_{dev_id}_hvac_sync_start",
-            f"{entry.entry_id}_{dev_id}_hvac_sync_end",
+        if (uid in legacy_exact or uid.startswith(legacy_prefix)) and (
+            # Already migrated on a previous setup: skip the registry write
+            ent.disabled_by is not RegistryEntryDisabler.INTEGRATION
+            or ent.hidden_by is not RegistryEntryHider.INTEGRATION
         ):
             ent_reg.async_update_entity(
                 ent.entity_id,
                 disabled_by=RegistryEntryDisabler.INTEGRATION,
                 hidden_by=RegistryEntryHider.INTEGRATION,
             )
-
-    return True
-
-
-async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
-    data = hass.data.get(DOMAIN, {}).pop(entry.entry_id, None)
-    if data:
-        coordinator: FelshareCoordinator = data["coordinator"]
-        hvac_sync = data.get("hvac_sync")
-        if hvac_sync is not None:
-            await hvac_sync.async_stop()
-        await coordinator.async_stop()
-    return unload_ok
@@ -7,16 +7,15 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.components.button import ButtonEntity
 from homeassistant.exceptions import HomeAssistantError
 
-from .const import DOMAIN
 from .coordinator import FelshareCoordinator
 from .entity import FelshareEntity
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback) -> None:
-    coordinator: FelshareCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    coordinator: FelshareCoordinator = entry.runtime_data.coordinator
     dev = coordinator.data.device_id
 
-    async_add_entities([FelshareRefreshButton(coordinator, entry, dev)])
+    async_add_entities((FelshareRefreshButton(coordinator, entry, dev),), update_before_add=False)
 
 
 class FelshareRefreshButton(FelshareEntity, ButtonEntity):
@@ -29,13 +28,10 @@ class FelshareRefreshButton(FelshareEntity, ButtonEntity):
     _attr_name = "Refresh status"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_icon = "mdi:refresh"
-
-    def __init__(self, coordinator: FelshareCoordinator, entry: ConfigEntry, dev: str) -> None:
-        super().__init__(coordinator, entry, dev)
-        self._attr_unique_id = f"{self._entry_id}_{dev}_refresh"
+    _uid_suffix = "refresh"
 
     async def async_press(self) -> None:
         try:
-            await self.hass.async_add_executor_job(self.coordinator.hub.request_status)
+            await self.coordinator.hub.async_request_status()
         except Exception as e:
             raise HomeAssistantError(str(e))
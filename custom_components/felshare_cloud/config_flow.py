@@ -9,6 +9,7 @@ from homeassistant import config_entries
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.util.json import json_loads
 
 from .const import (
     DOMAIN,
@@ -39,50 +40,46 @@ from .const import (
 )
 
 
+_HTTP_HEADERS = {
+    "Content-Type": "application/json",
+    "Accept": "application/json",
+    "User-Agent": f"HomeAssistant-Felshare/{VERSION}",
+}
+
+
 async def _login_and_devices(hass: HomeAssistant, email: str, password: str) -> list[dict]:
     """Login and fetch device list using HA's aiohttp session (no external deps)."""
     session = async_get_clientsession(hass)
 
-    headers = {
-        "Content-Type": "application/json",
-        "Accept": "application/json",
-        "User-Agent": f"HomeAssistant-Felshare/{VERSION}",
-    }
-
-    # Login
+    # Both requests share one timeout; the device list needs the login token,
+    # so they cannot run concurrently.
+    step = "Login"
     try:
-        async with asyncio.timeout(20):
+        async with asyncio.timeout(25):
             resp = await session.post(
                 f"{API_BASE}/login",
                 json={"username": email, "password": password},
-                headers=headers,
+                headers=_HTTP_HEADERS,
             )
             if resp.status in (401, 403):
                 raise ConnectionError("Login rejected")
             if resp.status == 429:
                 raise ConnectionError("Login rate-limited")
-            data = await resp.json(content_type=None)
-    except Exception as err:
-        raise ConnectionError(f"Login error: {err}") from err
+            data = await resp.json(content_type=None, loads=json_loads)
 
-    token = None
-    if isinstance(data, dict):
-        token = (data.get("data") or {}).get("token")
-    if not token:
-        raise ConnectionError("Login failed")
+            token = None
+            if isinstance(data, dict):
+                token = (data.get("data") or {}).get("token")
+            if not token:
+                raise ConnectionError("Login failed")
 
-    # Devices
-    try:
-        async with asyncio.timeout(20):
-            resp = await session.get(
-                f"{API_BASE}/device",
-                headers={"token": token, "Accept": "application/json", "User-Agent": f"HomeAssistant-Felshare/{VERSION}"},
-            )
+            step = "Device list"
+            resp = await session.get(f"{API_BASE}/device", headers={**_HTTP_HEADERS, "token": token})
             if resp.status == 429:
                 raise ConnectionError("Device list rate-limited")
-            dd = await resp.json(content_type=None)
+            dd = await resp.json(content_type=None, loads=json_loads)
     except Exception as err:
-        raise ConnectionError(f"Device list error: {err}") from err
+        raise ConnectionError(f"{step} error: {err}") from err
 
     devs = dd.get("data") if isinstance(dd, dict) else None
     if not isinstance(devs, list):
@@ -90,7 +87,14 @@ async def _login_and_devices(hass: HomeAssistant, email: str, password: str) ->
     return devs
 
 
-def _pick(d: dict, *keys: str) -> Any | None:
+# Candidate keys for device fields (the cloud API is not consistent across models)
+_ID_KEYS = ("device_id", "deviceId", "devId", "id", "name")
+_NAME_KEYS = ("device_name", "deviceName", "alias", "nickName", "name")
+_MODEL_KEYS = ("model", "product", "productName", "product_name", "type")
+_STATE_KEYS = ("state", "online", "isOnline", "device_state")
+
+
+def _pick(d: dict, keys: tuple[str, ...]) -> Any | None:
     for k in keys:
         v = d.get(k)
         if v is not None and v != "":
@@ -130,23 +134,27 @@ class FelshareConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     if not isinstance(d, dict):
                         continue
 
-                    device_id = _pick(d, "device_id", "deviceId", "devId", "id", "name")
+                    device_id = _pick(d, _ID_KEYS)
                     if not device_id:
                         continue
                     device_id = str(device_id)
 
-                    device_name = _pick(d, "device_name", "deviceName", "alias", "nickName", "name")
+                    device_name = _pick(d, _NAME_KEYS)
                     if device_name:
                         device_name = str(device_name).strip()
-                    model = _pick(d, "model", "product", "productName", "product_name", "type")
-                    state = _pick(d, "state", "online", "isOnline", "device_state")
-
-                    # label shown in selector
-                    label = device_id
-                    if device_name and device_name != device_id:
-                        label = f"{device_name} — {device_id}"
-                    if state is not None:
-                        label = f"{label} (state={state})"
+                    model = _pick(d, _MODEL_KEYS)
+                    state = _pick(d, _STATE_KEYS)
+
+                    # label shown in selector (one formatted string per device)
+                    named = bool(device_name) and device_name != device_id
+                    if state is None:
+                        label = f"{device_name} — {device_id}" if named else device_id
+                    else:
+                        label = (
+                            f"{device_name} — {device_id} (state={state})"
+                            if named
+                            else f"{device_id} (state={state})"
+                        )
 
                     options[device_id] = label
                     devmap[device_id] = d
@@ -180,9 +188,9 @@ class FelshareConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             self._abort_if_unique_id_configured()
 
             raw = self._device_map.get(device_id, {})
-            device_name = _pick(raw, "device_name", "deviceName", "alias", "nickName", "name")
-            device_model = _pick(raw, "model", "product", "productName", "product_name", "type")
-            device_state = _pick(raw, "state", "online", "isOnline", "device_state")
+            device_name = _pick(raw, _NAME_KEYS)
+            device_model = _pick(raw, _MODEL_KEYS)
+            device_state = _pick(raw, _STATE_KEYS)
 
             title = str(device_name).strip() if device_name else f"Felshare {device_id}"
 
@@ -1,14 +1,20 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import timedelta
 from typing import Any
 
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .models import FelshareState
 from .hub import FelshareHub
 
+# Work-day toggles arriving within this window are sent as one WorkTime publish.
+_WORK_DAYS_FLUSH_DELAY_S = 0.08
+
 
 class FelshareCoordinator(DataUpdateCoordinator[FelshareState]):
     """Push-based coordinator (MQTT thread -> HA loop)."""
@@ -23,19 +29,93 @@ class FelshareCoordinator(DataUpdateCoordinator[FelshareState]):
         self.hub = hub
         self.data = hub.state
 
+        # Pending work-day toggles awaiting a coalesced publish: bits to set, and the
+        # 7-bit mask of bits to keep (cleared bits are 0). Both stay within 0x7F.
+        self._days_set_bits = 0
+        self._days_keep_bits = 0x7F
+        self._unsub_days_flush: CALLBACK_TYPE | None = None
+        # Resolved by the flush so every toggle in the batch sees the publish result
+        self._days_flush_fut: asyncio.Future[None] | None = None
+        # Mask before the batch's first toggle, and the last optimistic mask we wrote
+        # (used to roll back only if no RXD frame replaced it meanwhile)
+        self._days_prev_mask: int | None = None
+        self._days_optimistic_mask: int | None = None
+
     async def async_start(self) -> None:
         # Start hub (login + mqtt)
         await self.hub.async_start(self._on_state)
 
     async def async_stop(self) -> None:
+        if self._unsub_days_flush is not None:
+            self._unsub_days_flush()
+            self._unsub_days_flush = None
+        fut, self._days_flush_fut = self._days_flush_fut, None
+        if fut is not None and not fut.done():
+            fut.set_exception(HomeAssistantError("Work days not sent: integration is unloading"))
         await self.hub.async_stop()
 
-    def _on_state(self, state: FelshareState) -> None:
-        """Called from hub thread; marshal back to HA event loop."""
-        self.hass.loop.call_soon_threadsafe(self._async_set_state, state)
+    @callback
+    def async_queue_work_day(self, bit: int, inv_bit: int, on: bool) -> asyncio.Future[None]:
+        """Queue a single work-day toggle and optimistically reflect it in state.
+
+        Returns a future completed by the coalesced publish; it raises
+        HomeAssistantError if the publish failed (the toggle is rolled back).
+        """
+        d = self.data
+        if self._days_flush_fut is None:
+            # First toggle of a batch
+            self._days_prev_mask = d.work_days_mask
+            self._days_flush_fut = self.hass.loop.create_future()
+
+        if on:
+            self._days_set_bits |= bit
+            self._days_keep_bits |= bit
+        else:
+            # inv_bit is the day's precomputed 0x7F ^ bit
+            self._days_set_bits &= inv_bit
+            self._days_keep_bits &= inv_bit
+
+        mask = d.work_days_mask if d.work_days_mask is not None else 0x7F
+        mask = (mask | self._days_set_bits) & self._days_keep_bits
+        self._days_optimistic_mask = mask
+        self.hub.set_work_days_mask(mask)
+        self.async_set_updated_data(d)
+
+        if self._unsub_days_flush is None:
+            self._unsub_days_flush = async_call_later(self.hass, _WORK_DAYS_FLUSH_DELAY_S, self._async_flush_work_days)
+        return self._days_flush_fut
+
+    @callback
+    def _async_flush_work_days(self, _now) -> None:
+        self._unsub_days_flush = None
+        set_bits, keep_bits = self._days_set_bits, self._days_keep_bits
+        self._days_set_bits = 0
+        self._days_keep_bits = 0x7F
+        fut, self._days_flush_fut = self._days_flush_fut, None
+        prev_mask, optimistic_mask = self._days_prev_mask, self._days_optimistic_mask
+
+        # Re-apply the deltas in case an RXD frame replaced the mask meanwhile.
+        d = self.data
+        mask = d.work_days_mask if d.work_days_mask is not None else 0x7F
+        mask = (mask | set_bits) & keep_bits
+        try:
+            self.hub.publish_work_schedule(days_mask=mask)
+        except Exception as e:
+            self.logger.warning("Work days publish failed: %s", e)
+            # Nothing was sent: undo the optimistic toggles unless the device reported
+            # its own mask in the meantime.
+            if d.work_days_mask == optimistic_mask:
+                self.hub.set_work_days_mask(prev_mask)
+                self.async_set_updated_data(d)
+            if fut is not None and not fut.done():
+                fut.set_exception(HomeAssistantError(str(e)))
+            return
+        if fut is not None and not fut.done():
+            fut.set_result(None)
 
     @callback
-    def _async_set_state(self, state: FelshareState) -> None:
+    def _on_state(self, state: FelshareState) -> None:
+        """Called on the HA loop; the hub coalesces and marshals updates from its thread."""
         self.async_set_updated_data(state)
 
     async def _async_update_data(self) -> FelshareState:
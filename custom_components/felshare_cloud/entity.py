@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+import time
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.device_registry import DeviceInfo
@@ -19,28 +19,39 @@ from .const import (
 from .coordinator import FelshareCoordinator
 
 
+_OFFLINE_AFTER_S = OFFLINE_AFTER_MINUTES * 60
+
+
 class FelshareEntity(CoordinatorEntity[FelshareCoordinator]):
     """Common base for all Felshare entities.
 
     - Provides consistent Device Info (name/model/config URL)
     - Implements a safer availability policy (offline after N minutes without updates)
+    - Builds the unique_id from `_uid_suffix` (a class attribute, or set on the
+      instance before calling this __init__ for per-instance entities)
     """
 
+    _uid_suffix: str | None = None
+
     def __init__(self, coordinator: FelshareCoordinator, entry: ConfigEntry, dev: str) -> None:
         super().__init__(coordinator)
         self._entry = entry
         self._entry_id = entry.entry_id
         self._dev = dev
+        # HVAC Sync controller for this entry; it outlives the entities (recreated on reload)
+        self._hvac_ctl = entry.runtime_data.hvac_sync
+        # Pre-bound helper used by the option-backed write handlers
+        self._update_entry = coordinator.hass.config_entries.async_update_entry
+        if self._uid_suffix is not None:
+            self._attr_unique_id = f"{self._entry_id}_{dev}_{self._uid_suffix}"
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        name = self._entry.data.get(CONF_DEVICE_NAME) or f"Felshare {self._dev}"
-        model = self._entry.data.get(CONF_DEVICE_MODEL) or "Smart Diffuser"
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._dev)},
-            name=name,
+        # Device name/model live in entry.data (set once by the config flow) and
+        # entities are recreated on reload, so DeviceInfo is built once per entity.
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, dev)},
+            name=entry.data.get(CONF_DEVICE_NAME) or f"Felshare {dev}",
             manufacturer="Felshare",
-            model=model,
+            model=entry.data.get(CONF_DEVICE_MODEL) or "Smart Diffuser",
             configuration_url=FRONT_URL,
         )
 
@@ -49,15 +60,17 @@ class FelshareEntity(CoordinatorEntity[FelshareCoordinator]):
         data = self.coordinator.data
         if data.connected:
             return True
-        if not data.last_seen:
+        if data.last_seen_mono is None:
             return False
-        try:
-            return (datetime.utcnow() - data.last_seen) < timedelta(minutes=OFFLINE_AFTER_MINUTES)
-        except Exception:
-            # If something goes weird with timestamps, prefer not to flip entities to unavailable.
-            return True
+        return (time.monotonic() - data.last_seen_mono) < _OFFLINE_AFTER_S
 
     # ---------------- UX helpers ----------------
+    def _request_hvac_sync_evaluate(self) -> None:
+        """Ask HVAC Sync to re-evaluate soon (coalesced; does not block the caller)."""
+        ctl = self._hvac_ctl
+        if ctl is not None:
+            ctl.async_request_evaluate(force=True)
+
     def _hvac_sync_enabled(self) -> bool:
         """Return True when HVAC Sync mode is enabled for this config entry."""
         try:
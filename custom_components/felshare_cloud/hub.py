@@ -3,21 +3,22 @@ from __future__ import annotations
 import json
 import logging
 import random
+import re
 import ssl
+import struct
 import threading
 import time
 import urllib.error
 import urllib.parse
 import urllib.request
 from collections import OrderedDict, deque
-from datetime import datetime
 from typing import Callable, Optional
 
 import paho.mqtt.client as mqtt
 from paho.mqtt.client import CallbackAPIVersion
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.storage import Store
 
 from .const import (
@@ -53,8 +54,92 @@ from .const import (
 from .models import FelshareState
 
 
+# Invoked on the HA event loop with the (shared, mutable) hub state.
 StateCallback = Callable[[FelshareState], None]
 
+# Days mask -> "Mon,Tue,..." ("-" when empty), precomputed for all 128 masks.
+# Device mapping: Sun=1, Mon=2, Tue=4, Wed=8, Thu=16, Fri=32, Sat=64 (listed Mon..Sun)
+_DAY_ORDER = (("Mon", 0x02), ("Tue", 0x04), ("Wed", 0x08), ("Thu", 0x10), ("Fri", 0x20), ("Sat", 0x40), ("Sun", 0x01))
+_DAYS_BY_MASK: tuple[str, ...] = tuple(
+    ",".join(name for name, bit in _DAY_ORDER if mask & bit) or "-" for mask in range(0x80)
+)
+# Same, space separated ("Mon Tue"), for the work schedule summary
+_DAYS_DISPLAY_BY_MASK: tuple[str, ...] = tuple(days.replace(",", " ") for days in _DAYS_BY_MASK)
+
+# Day name tokens (EN/ES, plus single letters) -> days mask bit; "all" words map to 0x7F.
+_DAY_BITS: dict[str, int] = {
+    # English
+    "mon": 2,
+    "monday": 2,
+    "tue": 4,
+    "tues": 4,
+    "tuesday": 4,
+    "wed": 8,
+    "wednesday": 8,
+    "thu": 16,
+    "thur": 16,
+    "thurs": 16,
+    "thursday": 16,
+    "fri": 32,
+    "friday": 32,
+    "sat": 64,
+    "saturday": 64,
+    "sun": 1,
+    "sunday": 1,
+    # Spanish
+    "lun": 2,
+    "lunes": 2,
+    "mar": 4,
+    "martes": 4,
+    "mie": 8,
+    "mié": 8,
+    "mier": 8,
+    "miércoles": 8,
+    "miercoles": 8,
+    "jue": 16,
+    "jueves": 16,
+    "vie": 32,
+    "viernes": 32,
+    "sab": 64,
+    "sáb": 64,
+    "sábado": 64,
+    "sabado": 64,
+    "dom": 1,
+    "domingo": 1,
+    # Short single-letter (optional)
+    "m": 2,
+    "t": 4,
+    "w": 8,
+    "r": 16,
+    "f": 32,
+    "s": 64,
+    "u": 1,
+    # Every day
+    "all": 0x7F,
+    "every": 0x7F,
+    "todos": 0x7F,
+    "diario": 0x7F,
+    "daily": 0x7F,
+}
+_DAY_SPLIT_RE = re.compile(r"[,;|]")
+
+# Pre-compiled big-endian unpackers for the RXD parsers (unpack_from avoids slicing)
+_U16 = struct.Struct(">H")
+_U16X2 = struct.Struct(">HH")
+# WorkTime body: sh sm eh em flag run stop
+_WORK_STRUCT = struct.Struct(">BBBBBHH")
+
+# Learned sync payload: delayed Store write (re-learn bursts collapse into one save)
+_SYNC_PAYLOAD_SAVE_DELAY_S = 5.0
+
+# Fixed command frames
+_REQ_STATUS = b"\x05"
+_REQ_BULK = b"\x0C"
+_CMD_POWER_ON = b"\x03\x01"
+_CMD_POWER_OFF = b"\x03\x00"
+_CMD_FAN_ON = b"\x04\x01"
+_CMD_FAN_OFF = b"\x04\x00"
+
 
 def _bytes_to_hex(b: bytes) -> str:
     return b.hex(" ", 1)
@@ -74,11 +159,15 @@ class FelshareHub:
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         self.hass = hass
         self.entry = entry
+        # Bound once: the MQTT thread hands work to the HA loop through this on every burst
+        self._call_soon_ts = hass.loop.call_soon_threadsafe
         self.logger = logging.getLogger(__name__)
 
         self.email: str = entry.data[CONF_EMAIL]
         self.password: str = entry.data[CONF_PASSWORD]
         self.device_id: str = entry.data[CONF_DEVICE_ID]
+        self._topic_rxd = f"/device/rxd/{self.device_id}"
+        self._topic_txd = f"/device/txd/{self.device_id}"
 
         # Options (safe defaults)
         self._enable_txd_learning = bool(
@@ -122,11 +211,24 @@ class FelshareHub:
 
         self.state = FelshareState(device_id=self.device_id)
 
+        # RXD opcode -> parser; built once so on_message does a single dict lookup per frame
+        self._dispatch: dict[int, Callable[[bytes], None]] = {
+            0x05: self._parse_rxd_status,
+            0x0C: self._parse_bulk_settings,
+            0x32: self._parse_workmode_frame,
+            0x03: self._simple_power,
+            0x04: self._simple_fan,
+            0x08: self._simple_oil_name,
+            0x0E: self._simple_cons,
+            0x0F: self._simple_cap,
+            0x10: self._simple_remain,
+        }
+
         # Learn/persist the app's "status request" TXD payload so HA can request state on startup.
         self._store = Store(hass, 1, f"{DOMAIN}.sync_{entry.entry_id}")
         self._sync_payload: bytes | None = None
         self._last_txd_payload: bytes | None = None
-        self._last_txd_ts: float = 0.0
+        self._last_txd_ts: float = 0.0  # time.monotonic() of the last TXD frame
 
         self._token: Optional[str] = None
         self._mqtt: Optional[mqtt.Client] = None
@@ -135,8 +237,13 @@ class FelshareHub:
         self._last_connect_rc: int | None = None
         self._last_disconnect_rc: int | None = None
         self._stop = threading.Event()
+        # Set by on_connect (any result) or stop, so the connect wait blocks instead of polling
+        self._connect_evt = threading.Event()
         self._thread: Optional[threading.Thread] = None
         self._cb: Optional[StateCallback] = None
+        # At most one state delivery is queued on the HA loop at a time
+        self._emit_lock = threading.Lock()
+        self._emit_scheduled = False
 
         self._lock = threading.Lock()
 
@@ -174,31 +281,58 @@ class FelshareHub:
 
     def _stop_blocking(self) -> None:
         self._stop.set()
+        self._connect_evt.set()
         self._stop_mqtt_client()
         with self._outbox_cv:
             self._outbox.clear()
             self._outbox_cv.notify_all()
 
     def _emit(self) -> None:
-        # Callback is expected to be thread-safe (coordinator marshals into HA loop).
-        if self._cb:
-            try:
-                self._cb(self.state)
-            except Exception:
-                # Never let callback exceptions crash the MQTT thread.
-                self.logger.debug("State callback raised", exc_info=True)
-
-    def _persist_sync_payload(self, payload: bytes) -> None:
+        if self._cb is None:
+            return
+        # Bursts of frames (status + bulk + work mode) mutate the same state object, so
+        # one pending delivery covers them all: skip the loop wakeup if one is queued.
+        with self._emit_lock:
+            if self._emit_scheduled:
+                return
+            self._emit_scheduled = True
         try:
-            from asyncio import run_coroutine_threadsafe
+            self._call_soon_ts(self._deliver_state)
+        except RuntimeError:
+            # Event loop closed (HA shutting down)
+            with self._emit_lock:
+                self._emit_scheduled = False
+
+    def _deliver_state(self) -> None:
+        """Runs on the HA loop; hands the latest state to the coordinator."""
+        with self._emit_lock:
+            self._emit_scheduled = False
+        cb = self._cb
+        if cb is None:
+            return
+        try:
+            cb(self.state)
+        except Exception:
+            self.logger.debug("State callback raised", exc_info=True)
 
-            run_coroutine_threadsafe(
-                self._store.async_save({"payload_hex": payload.hex()}),
-                self.hass.loop,
-            )
-        except Exception as e:
+    def _persist_sync_payload(self) -> None:
+        """Persist the learned sync payload (MQTT thread; the write happens on the loop)."""
+        try:
+            self._call_soon_ts(self._async_schedule_sync_save)
+        except RuntimeError as e:
+            # Event loop closed (HA shutting down)
             self.logger.debug("Failed persisting sync payload: %s", e)
 
+    @callback
+    def _async_schedule_sync_save(self) -> None:
+        # Delayed save: a burst of re-learned payloads collapses into one write of the
+        # latest value, and Store flushes pending data on HA shutdown.
+        self._store.async_delay_save(self._sync_payload_data, _SYNC_PAYLOAD_SAVE_DELAY_S)
+
+    @callback
+    def _sync_payload_data(self) -> dict:
+        return {"payload_hex": self._sync_payload.hex()} if self._sync_payload else {}
+
     def _rc_to_int(self, rc) -> int | None:
         if rc is None:
             return None
@@ -254,12 +388,13 @@ class FelshareHub:
         # Status request (sync payload if learned; else 0x05)
         try:
             self.state.last_status_request_ts = now
-            payload = self._sync_payload if self._sync_payload else b"\x05"
-            self.logger.debug(
-                "request_status sending status_request (sync=%s) payload=%s",
-                bool(self._sync_payload),
-                _bytes_to_hex(payload),
-            )
+            payload = self._sync_payload if self._sync_payload else _REQ_STATUS
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    "request_status sending status_request (sync=%s) payload=%s",
+                    bool(self._sync_payload),
+                    _bytes_to_hex(payload),
+                )
             self._publish(payload, key="status_request")
         except Exception as e:
             self.logger.debug("request_status status publish failed: %s", e)
@@ -272,7 +407,7 @@ class FelshareHub:
                     "request_status sending bulk_request 0x0C (min_interval=%.0fs)",
                     self._bulk_min_interval_s,
                 )
-                self._publish(b"\x0C", key="bulk_request")
+                self._publish(_REQ_BULK, key="bulk_request")
             except Exception as e:
                 self.logger.debug("request_status bulk publish failed: %s", e)
         else:
@@ -451,6 +586,7 @@ class FelshareHub:
 
         self._last_connect_rc = None
         self._last_disconnect_rc = None
+        self._connect_evt.clear()
 
         c = mqtt.Client(
             callback_api_version=CallbackAPIVersion.VERSION2,
@@ -471,8 +607,8 @@ class FelshareHub:
         c.ws_set_options(path=MQTT_WS_PATH, headers=ws_headers)
         c.reconnect_delay_set(min_delay=1, max_delay=30)
 
-        topic_rxd = f"/device/rxd/{dev}"
-        topic_txd = f"/device/txd/{dev}"
+        topic_rxd = self._topic_rxd
+        topic_txd = self._topic_txd
 
         def on_connect(client, userdata, flags, reason_code, properties=None):
             rc_int = self._rc_to_int(reason_code)
@@ -496,6 +632,7 @@ class FelshareHub:
             else:
                 self.logger.error("MQTT connect failed (rc=%s)", rc_int)
                 self._set_connected(False)
+            self._connect_evt.set()
 
         def on_disconnect(client, userdata, disconnect_flags, reason_code, properties=None):
             self._last_disconnect_rc = self._rc_to_int(reason_code)
@@ -507,72 +644,81 @@ class FelshareHub:
             with self._outbox_cv:
                 self._outbox_cv.notify_all()
 
-        def on_message(client, userdata, msg):
+        def _seen(topic: str, payload: bytes) -> float:
+            """Record frame visibility; returns the monotonic receive time."""
+            # Wall clock is only for display; staleness checks use the monotonic read
+            now_mono = time.monotonic()
+            self.state.last_seen_ts = time.time()
+            self.state.last_seen_mono = now_mono
+            # Canonical topic string rather than paho's fresh copy
+            self.state.last_topic = topic
+            self.state.last_payload = payload
+            return now_mono
+
+        def on_txd(client, userdata, msg):
             payload: bytes = msg.payload or b""
-            now_ts = time.time()
-            self.state.last_seen = datetime.utcnow()
-            self.state.last_seen_ts = now_ts
-            self.state.last_topic = msg.topic
-            self.state.last_payload_hex = _bytes_to_hex(payload)
-
+            now_mono = _seen(topic_txd, payload)
             # Remember last TXD payload (optional "learning" mode only).
-            if self._enable_txd_learning and msg.topic == topic_txd and payload:
+            if self._enable_txd_learning and payload:
                 self._last_txd_payload = payload
-                self._last_txd_ts = now_ts
+                self._last_txd_ts = now_mono
+            self._emit()
 
-            # Parse frames coming from the device (RXD only).
-            if payload and msg.topic == topic_rxd:
-                if payload[0] == 0x05:
-                    # If we just saw a TXD packet and now we get a status frame, learn the TXD as "sync" request.
+        def on_rxd(client, userdata, msg):
+            payload: bytes = msg.payload or b""
+            now_mono = _seen(topic_rxd, payload)
+
+            # Parse frames coming from the device.
+            if payload:
+                op = payload[0]
+                # If we just saw a TXD packet and now we get a status frame, learn the TXD as "sync" request.
+                txd = self._last_txd_payload
+                if (
+                    op == 0x05
+                    and self._enable_txd_learning
+                    and txd
+                    and (now_mono - self._last_txd_ts) < 2.0
+                ):
+                    # Ignore our own "set" commands; we want the app's "status request".
+                    # Once learned, the app keeps resending the same bytes: the identity test
+                    # short-circuits the common "already learned" case before comparing content.
                     if (
-                        self._enable_txd_learning
-                        and self._last_txd_payload
-                        and (now_ts - self._last_txd_ts) < 2.0
+                        txd[0] not in (0x03, 0x04, 0x08, 0x0E, 0x0F, 0x10, 0x32)
+                        and txd is not self._sync_payload
+                        and txd != self._sync_payload
                     ):
-                        op = self._last_txd_payload[0]
-                        # Ignore our own "set" commands; we want the app's "status request".
-                        if op not in (0x03, 0x04, 0x08, 0x0E, 0x0F, 0x10, 0x32):
-                            if self._sync_payload != self._last_txd_payload:
-                                self._sync_payload = self._last_txd_payload
-                                self._persist_sync_payload(self._last_txd_payload)
-                                self.logger.info(
-                                    "Learned sync payload from app: %s",
-                                    _bytes_to_hex(self._last_txd_payload),
-                                )
-                    self._parse_rxd_status(payload)
-                elif payload[0] == 0x0C:
-                    self._parse_bulk_settings(payload)
-                elif payload[0] == 0x32:
-                    self._parse_workmode_frame(payload)
-                else:
-                    self._parse_simple_frame(payload)
+                        self._sync_payload = txd
+                        self._persist_sync_payload()
+                        self.logger.info("Learned sync payload from app: %s", _bytes_to_hex(txd))
+                handler = self._dispatch.get(op)
+                if handler is not None:
+                    handler(payload)
 
             self._emit()
 
         c.on_connect = on_connect
         c.on_disconnect = on_disconnect
-        c.on_message = on_message
+        # paho routes each subscribed topic straight to its handler (no on_message fan-out)
+        c.message_callback_add(topic_rxd, on_rxd)
+        c.message_callback_add(topic_txd, on_txd)
 
         try:
             c.connect(MQTT_HOST, MQTT_PORT, keepalive=20)
             c.loop_start()
 
             # wait for connect or stop
-            t0 = time.time()
-            while not self._stop.is_set():
-                if self.state.connected:
-                    return
-
-                # If broker rejected the connection, fail fast.
-                if self._last_connect_rc is not None and self._last_connect_rc != 0:
-                    rc = self._last_connect_rc
-                    if rc in (4, 5):
-                        raise PermissionError(f"MQTT not authorized (rc={rc})")
-                    raise RuntimeError(f"MQTT connect failed (rc={rc})")
-
-                if time.time() - t0 > 15:
-                    raise RuntimeError("MQTT connect timeout")
-                time.sleep(0.1)
+            if self._stop.is_set():
+                return
+            if not self._connect_evt.wait(15):
+                raise RuntimeError("MQTT connect timeout")
+            if self._stop.is_set() or self.state.connected:
+                return
+
+            # Broker rejected the connection: fail fast.
+            rc = self._last_connect_rc
+            if rc in (4, 5):
+                raise PermissionError(f"MQTT not authorized (rc={rc})")
+            raise RuntimeError(f"MQTT connect failed (rc={rc})")
         except Exception:
             # Ensure we don't leak a paho thread when the connect attempt fails.
             with self._lock:
@@ -614,7 +760,7 @@ class FelshareHub:
 
     # ---------------- outbound publish queue ----------------
     def _payload_key(self, payload: bytes) -> str:
-        if payload == b"\x0C":
+        if payload == _REQ_BULK:
             return "bulk_request"
         if payload and payload[0] == 0x05:
             return "status_request"
@@ -657,9 +803,8 @@ class FelshareHub:
     def _service_outbox_until_disconnect(self) -> None:
         """Runs in the hub thread while MQTT is connected."""
         while not self._stop.is_set():
-            with self._lock:
-                connected = self._mqtt is not None and self.state.connected
-            if not connected:
+            # Single reference loads are atomic; _lock only guards teardown assignments
+            if self._mqtt is None or not self.state.connected:
                 return
 
             key: str | None = None
@@ -685,18 +830,18 @@ class FelshareHub:
                 continue
 
             try:
-                self.logger.debug(
-                    "TX send key=%s payload=%s outbox_len=%s",
-                    key,
-                    _bytes_to_hex(payload),
-                    self.state.outbox_len,
-                )
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(
+                        "TX send key=%s payload=%s outbox_len=%s",
+                        key,
+                        _bytes_to_hex(payload),
+                        self.state.outbox_len,
+                    )
                 self._publish_now(payload)
                 # Diagnostics for last TX
-                now_ts = time.time()
-                self.state.last_tx_ts = now_ts
+                self.state.last_tx_ts = time.time()
                 self.state.last_tx_key = key
-                self.state.last_tx_payload_hex = _bytes_to_hex(payload)
+                self.state.last_tx_payload = payload
             except Exception as e:
                 # If disconnected mid-flight, requeue and let reconnect logic handle it.
                 self.logger.warning("Publish failed (%s): %s", key, e)
@@ -710,14 +855,12 @@ class FelshareHub:
                 return
 
     def _publish_now(self, payload: bytes) -> None:
-        dev = self.device_id
-        topic = f"/device/txd/{dev}"
-        with self._lock:
-            c = self._mqtt
+        # One GIL-atomic load of the reference is enough for a snapshot; no lock needed.
+        c = self._mqtt
         if not c or not self.state.connected:
             raise RuntimeError("MQTT not connected")
 
-        c.publish(topic, payload, qos=0, retain=False)
+        c.publish(self._topic_txd, payload, qos=0, retain=False)
 
         now = time.time()
         self.state.last_publish_ts = now
@@ -725,10 +868,8 @@ class FelshareHub:
 
     def _publish(self, payload: bytes, *, key: str | None = None) -> None:
         """Enqueue a payload for outbound publish (coalesced + rate-limited)."""
-        with self._lock:
-            c = self._mqtt
-            connected = bool(c) and self.state.connected
-        if not connected:
+        # Lock-free snapshot: a single attribute load is atomic under the GIL.
+        if self._mqtt is None or not self.state.connected:
             raise RuntimeError("MQTT not connected")
 
         k = key or self._payload_key(payload)
@@ -738,10 +879,11 @@ class FelshareHub:
             # Ensure the newest request for the same key is sent last.
             self._outbox.move_to_end(k, last=True)
             self.state.outbox_len = len(self._outbox)
-            if replaced:
-                self.logger.debug("TX coalesced key=%s payload=%s", k, _bytes_to_hex(payload))
-            else:
-                self.logger.debug("TX queued key=%s payload=%s outbox_len=%s", k, _bytes_to_hex(payload), self.state.outbox_len)
+            if self.logger.isEnabledFor(logging.DEBUG):
+                if replaced:
+                    self.logger.debug("TX coalesced key=%s payload=%s", k, _bytes_to_hex(payload))
+                else:
+                    self.logger.debug("TX queued key=%s payload=%s outbox_len=%s", k, _bytes_to_hex(payload), self.state.outbox_len)
             self._outbox_cv.notify_all()
 
     # ---------------- parsing ----------------
@@ -761,27 +903,21 @@ class FelshareHub:
                 self.state.fan_on = bool(p[10])
 
             if len(p) >= 15:
-                cons_raw = int.from_bytes(p[11:13], "big", signed=False)  # e.g. 0x0023 -> 35
-                cap = int.from_bytes(p[13:15], "big", signed=False)  # e.g. 0x00FA -> 250
-                if 0 <= cons_raw <= 2000:
+                # e.g. 0x0023 -> 35 (consumption tenths), 0x00FA -> 250 (capacity ml)
+                cons_raw, cap = _U16X2.unpack_from(p, 11)
+                if cons_raw <= 2000:
                     self.state.consumption = cons_raw / 10.0
                 if 0 < cap <= 5000:
                     self.state.capacity = cap
 
             if len(p) >= 22:
-                remain = int.from_bytes(p[20:22], "big", signed=False)
-                if 0 <= remain <= 10000:
+                (remain,) = _U16.unpack_from(p, 20)
+                if remain <= 10000:
                     self.state.remain_oil = remain
 
             # oil name
             if len(p) >= 26:
-                name_bytes = p[24:]
-                if 0 in name_bytes:
-                    name_bytes = name_bytes.split(b"\x00", 1)[0]
-                try:
-                    name = name_bytes.decode("utf-8", errors="ignore").strip()
-                except Exception:
-                    name = ""
+                name = p[24:].partition(b"\x00")[0].decode("utf-8", errors="ignore").strip()
                 if name:
                     self.state.oil_name = name
 
@@ -793,18 +929,17 @@ class FelshareHub:
             self.logger.debug("Failed parsing RXD payload: %s", e)
 
     def _decode_days_mask(self, mask: int) -> str:
-        # Device mapping: Sun=1, Mon=2, Tue=4, Wed=8, Thu=16, Fri=32, Sat=64
-        order = [
-            ("Mon", 0x02),
-            ("Tue", 0x04),
-            ("Wed", 0x08),
-            ("Thu", 0x10),
-            ("Fri", 0x20),
-            ("Sat", 0x40),
-            ("Sun", 0x01),
-        ]
-        out = [name for name, bit in order if mask & bit]
-        return ",".join(out) if out else "-"
+        return _DAYS_BY_MASK[mask & 0x7F]
+
+    def set_work_days_mask(self, mask: int | None) -> None:
+        """Set the days mask and its human-friendly strings on the state (no publish)."""
+        self.state.work_days_mask = mask
+        if mask is None:
+            self.state.work_days = self.state.work_days_display = None
+        else:
+            # Table lookups, no formatting
+            self.state.work_days = _DAYS_BY_MASK[mask & 0x7F]
+            self.state.work_days_display = _DAYS_DISPLAY_BY_MASK[mask & 0x7F]
 
     def _set_work_schedule(
         self,
@@ -818,14 +953,12 @@ class FelshareHub:
     ) -> None:
         self.state.work_start = f"{start_h:02d}:{start_m:02d}"
         self.state.work_end = f"{end_h:02d}:{end_m:02d}"
+        self.state.work_start_hm = (start_h, start_m)
+        self.state.work_end_hm = (end_h, end_m)
         self.state.work_flag_raw = flag & 0xFF
         self.state.work_enabled = bool(flag & 0x80)
-        self.state.work_days_mask = flag & 0x7F
         # Keep a human-friendly representation for UI entities.
-        try:
-            self.state.work_days = self._decode_days_mask(self.state.work_days_mask or 0)
-        except Exception:
-            self.state.work_days = None
+        self.set_work_days_mask(flag & 0x7F)
         self.state.work_run_s = int(run_s)
         self.state.work_stop_s = int(stop_s)
 
@@ -835,10 +968,7 @@ class FelshareHub:
             if len(p) != 11 or p[0] != 0x32:
                 return
             # 32 01 sh sm eh em flag runHi runLo stopHi stopLo
-            start_h, start_m, end_h, end_m = p[2], p[3], p[4], p[5]
-            flag = p[6]
-            run_s = int.from_bytes(p[7:9], "big", signed=False)
-            stop_s = int.from_bytes(p[9:11], "big", signed=False)
+            start_h, start_m, end_h, end_m, flag, run_s, stop_s = _WORK_STRUCT.unpack_from(p, 2)
             self.logger.debug(
                 "RX WorkTime: start=%02d:%02d end=%02d:%02d flag=0x%02X run=%ss stop=%ss",
                 start_h,
@@ -863,10 +993,7 @@ class FelshareHub:
             if len(p) < 20 or p[0] != 0x0C:
                 return
 
-            sh, sm, eh, em = p[11], p[12], p[13], p[14]
-            flag = p[15]
-            run_s = int.from_bytes(p[16:18], "big", signed=False)
-            stop_s = int.from_bytes(p[18:20], "big", signed=False)
+            sh, sm, eh, em, flag, run_s, stop_s = _WORK_STRUCT.unpack_from(p, 11)
             self.logger.debug(
                 "RX Bulk(0x0C) WorkTime: start=%02d:%02d end=%02d:%02d flag=0x%02X run=%ss stop=%ss",
                 sh,
@@ -877,69 +1004,61 @@ class FelshareHub:
                 run_s,
                 stop_s,
             )
-            # Basic sanity
-            if 0 <= sh <= 23 and 0 <= eh <= 23 and 0 <= sm <= 59 and 0 <= em <= 59:
+            # Basic sanity (unpacked B/H fields are unsigned, so only upper bounds matter)
+            if sh < 24 and eh < 24 and sm < 60 and em < 60:
                 self._set_work_schedule(sh, sm, eh, em, flag, run_s, stop_s)
         except Exception as e:
             self.logger.debug("Failed parsing bulk settings: %s", e)
 
-    def _parse_simple_frame(self, p: bytes) -> None:
-        """Parse simple single-property frames."""
-        try:
-            cmd = p[0]
-            # power: 0x03 0x01/0x00
-            if cmd == 0x03 and len(p) >= 2:
-                self.state.power_on = bool(p[1])
-                return
-
-            # fan: 0x04 0x01/0x00
-            if cmd == 0x04 and len(p) >= 2:
-                self.state.fan_on = bool(p[1])
-                return
-
-            # oil name: 0x08 + bytes
-            if cmd == 0x08 and len(p) >= 2:
-                name_bytes = p[1:]
-                if 0 in name_bytes:
-                    name_bytes = name_bytes.split(b"\x00", 1)[0]
-                name = name_bytes.decode("utf-8", errors="ignore").strip()
-                if name:
-                    self.state.oil_name = name
-                return
-
-            # consumption: 0x0E + uint16 (tenths ml/h)
-            if cmd == 0x0E and len(p) >= 3:
-                raw = int.from_bytes(p[1:3], "big", signed=False)
-                self.state.consumption = raw / 10.0
-                return
-
-            # capacity: 0x0F + uint16 (ml)
-            if cmd == 0x0F and len(p) >= 3:
-                raw = int.from_bytes(p[1:3], "big", signed=False)
-                self.state.capacity = raw
-                if self.state.remain_oil is not None and raw > 0:
-                    self.state.liquid_level = min(100, int((self.state.remain_oil * 100) // raw))
-                return
-
-            # remain oil: 0x10 + uint16 (ml)
-            if cmd == 0x10 and len(p) >= 3:
-                raw = int.from_bytes(p[1:3], "big", signed=False)
-                self.state.remain_oil = raw
-                if self.state.capacity and self.state.capacity > 0:
-                    self.state.liquid_level = min(100, int((raw * 100) // self.state.capacity))
-                return
-
-        except Exception as e:
-            self.logger.debug("Failed parsing simple frame: %s", e)
+    # Simple single-property frames (opcode + value). Each handler is only reached
+    # through self._dispatch, so p[0] is already known.
+    def _simple_power(self, p: bytes) -> None:
+        # power: 0x03 0x01/0x00
+        if len(p) >= 2:
+            self.state.power_on = bool(p[1])
+
+    def _simple_fan(self, p: bytes) -> None:
+        # fan: 0x04 0x01/0x00
+        if len(p) >= 2:
+            self.state.fan_on = bool(p[1])
+
+    def _simple_oil_name(self, p: bytes) -> None:
+        # oil name: 0x08 + bytes
+        if len(p) >= 2:
+            name = p[1:].partition(b"\x00")[0].decode("utf-8", errors="ignore").strip()
+            if name:
+                self.state.oil_name = name
+
+    def _simple_cons(self, p: bytes) -> None:
+        # consumption: 0x0E + uint16 (tenths ml/h)
+        if len(p) >= 3:
+            (raw,) = _U16.unpack_from(p, 1)
+            self.state.consumption = raw / 10.0
+
+    def _simple_cap(self, p: bytes) -> None:
+        # capacity: 0x0F + uint16 (ml)
+        if len(p) >= 3:
+            (raw,) = _U16.unpack_from(p, 1)
+            self.state.capacity = raw
+            if self.state.remain_oil is not None and raw > 0:
+                self.state.liquid_level = min(100, int((self.state.remain_oil * 100) // raw))
+
+    def _simple_remain(self, p: bytes) -> None:
+        # remain oil: 0x10 + uint16 (ml)
+        if len(p) >= 3:
+            (raw,) = _U16.unpack_from(p, 1)
+            self.state.remain_oil = raw
+            if self.state.capacity and self.state.capacity > 0:
+                self.state.liquid_level = min(100, int((raw * 100) // self.state.capacity))
 
     # ---------------- commands ----------------
     def publish_power(self, on: bool) -> None:
-        self._publish(bytes([0x03, 0x01 if on else 0x00]), key="power")
+        self._publish(_CMD_POWER_ON if on else _CMD_POWER_OFF, key="power")
         self.state.power_on = on
         self._emit()
 
     def publish_fan(self, on: bool) -> None:
-        self._publish(bytes([0x04, 0x01 if on else 0x00]), key="fan")
+        self._publish(_CMD_FAN_ON if on else _CMD_FAN_OFF, key="fan")
         self.state.fan_on = on
         self._emit()
 
@@ -983,76 +1102,29 @@ class FelshareHub:
         if value is None:
             raise ValueError("days is None")
 
-        raw = value.strip()
+        raw = value.strip().lower()
         if not raw:
             return 0
 
         # Allow numeric masks too (e.g. '0x7F' or '127')
         try:
-            if raw.lower().startswith("0x"):
+            if raw.startswith("0x"):
                 return int(raw, 16) & 0x7F
             if raw.isdigit():
                 return int(raw) & 0x7F
         except Exception:
             pass
 
-        tokens = [t.strip().lower() for t in raw.replace(";", ",").replace("|", ",").split(",") if t.strip()]
-        mapping = {
-            # English
-            "mon": 2,
-            "monday": 2,
-            "tue": 4,
-            "tues": 4,
-            "tuesday": 4,
-            "wed": 8,
-            "wednesday": 8,
-            "thu": 16,
-            "thur": 16,
-            "thurs": 16,
-            "thursday": 16,
-            "fri": 32,
-            "friday": 32,
-            "sat": 64,
-            "saturday": 64,
-            "sun": 1,
-            "sunday": 1,
-            # Spanish
-            "lun": 2,
-            "lunes": 2,
-            "mar": 4,
-            "martes": 4,
-            "mie": 8,
-            "mié": 8,
-            "mier": 8,
-            "miércoles": 8,
-            "miercoles": 8,
-            "jue": 16,
-            "jueves": 16,
-            "vie": 32,
-            "viernes": 32,
-            "sab": 64,
-            "sáb": 64,
-            "sábado": 64,
-            "sabado": 64,
-            "dom": 1,
-            "domingo": 1,
-            # Short single-letter (optional)
-            "m": 2,
-            "t": 4,
-            "w": 8,
-            "r": 16,
-            "f": 32,
-            "s": 64,
-            "u": 1,
-        }
-
         mask = 0
-        for tok in tokens:
-            if tok in ("all", "every", "todos", "diario", "daily"):
-                return 0x7F
-            bit = mapping.get(tok)
+        for tok in _DAY_SPLIT_RE.split(raw):
+            tok = tok.strip()
+            if not tok:
+                continue
+            bit = _DAY_BITS.get(tok)
             if bit is None:
                 raise ValueError(f"Unknown day token: {tok}")
+            if bit == 0x7F:
+                return 0x7F
             mask |= bit
         return mask & 0x7F
 
@@ -1068,19 +1140,9 @@ class FelshareHub:
         days: str | None = None,
     ) -> None:
         """Send WorkTime (32 01 ...) using current state as defaults."""
-        # Defaults
-        sh, sm = (9, 0)
-        eh, em = (21, 0)
-        if self.state.work_start:
-            try:
-                sh, sm = self._parse_hhmm(self.state.work_start)
-            except Exception:
-                pass
-        if self.state.work_end:
-            try:
-                eh, em = self._parse_hhmm(self.state.work_end)
-            except Exception:
-                pass
+        # Defaults (current times are kept pre-parsed by _set_work_schedule)
+        sh, sm = self.state.work_start_hm or (9, 0)
+        eh, em = self.state.work_end_hm or (21, 0)
 
         cur_run = self.state.work_run_s if self.state.work_run_s is not None else 30
         cur_stop = self.state.work_stop_s if self.state.work_stop_s is not None else 190
@@ -1168,6 +1230,83 @@ class FelshareHub:
     def publish_work_days(self, days: str) -> None:
         self.publish_work_schedule(days=days)
 
+    def apply_state(
+        self,
+        *,
+        work_start: str | None = None,
+        work_end: str | None = None,
+        work_run_s: int | None = None,
+        work_stop_s: int | None = None,
+        work_enabled: bool | None = None,
+        work_days_mask: int | None = None,
+        oil_name: str | None = None,
+        fan_on: bool | None = None,
+        power_on: bool | None = None,
+    ) -> None:
+        """Restore several settings at once (e.g. a saved manual snapshot).
+
+        The device protocol has one frame per setting, so this still queues one
+        frame each (WorkTime first, power last). Runs on the HA loop, so the pushes
+        of the individual publishes collapse into the single pending _deliver_state.
+        """
+        # WorkTime is always sent; unset fields keep their current values.
+        self.publish_work_schedule(
+            start=work_start,
+            end=work_end,
+            run_s=work_run_s,
+            stop_s=work_stop_s,
+            enabled=work_enabled,
+            days_mask=work_days_mask,
+        )
+        if oil_name is not None:
+            self.publish_oil_name(str(oil_name))
+        if fan_on is not None:
+            self.publish_fan(bool(fan_on))
+        if power_on is not None:
+            self.publish_power(bool(power_on))
+
+    # ---------------- commands (HA loop) ----------------
+    # publish_* only enqueue into the coalescing outbox (the hub thread does the actual
+    # MQTT I/O), so entities await these directly instead of hopping to the executor.
+    async def async_publish_power(self, on: bool) -> None:
+        self.publish_power(on)
+
+    async def async_publish_fan(self, on: bool) -> None:
+        self.publish_fan(on)
+
+    async def async_publish_oil_name(self, name: str) -> None:
+        self.publish_oil_name(name)
+
+    async def async_publish_consumption(self, value_ml_per_h: float) -> None:
+        self.publish_consumption(value_ml_per_h)
+
+    async def async_publish_capacity(self, ml: int) -> None:
+        self.publish_capacity(ml)
+
+    async def async_publish_remain_oil(self, ml: int) -> None:
+        self.publish_remain_oil(ml)
+
+    async def async_publish_work_schedule(self, **kwargs) -> None:
+        self.publish_work_schedule(**kwargs)
+
+    async def async_publish_work_enabled(self, on: bool) -> None:
+        self.publish_work_enabled(on)
+
+    async def async_publish_work_start(self, hhmm: str) -> None:
+        self.publish_work_start(hhmm)
+
+    async def async_publish_work_end(self, hhmm: str) -> None:
+        self.publish_work_end(hhmm)
+
+    async def async_publish_work_run_s(self, run_s: int) -> None:
+        self.publish_work_run_s(run_s)
+
+    async def async_publish_work_stop_s(self, stop_s: int) -> None:
+        self.publish_work_stop_s(stop_s)
+
+    async def async_request_status(self) -> None:
+        self.request_status()
+
     # ---------------- helpers ----------------
     def _as_int_option(self, key: str, default: int, *, min_v: int, max_v: int) -> int:
         try:
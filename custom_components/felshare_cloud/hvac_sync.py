@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
-from datetime import datetime, time as dtime, timedelta
+from datetime import datetime
+from enum import IntEnum
 import logging
-from typing import Callable, Optional
+import re
+import time
+from typing import Any, Callable, Optional
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, State, callback
-from homeassistant.helpers.event import async_call_later, async_track_state_change_event, async_track_time_interval
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.event import async_call_later, async_track_state_change_event
 from homeassistant.helpers.storage import Store
 from homeassistant.util import dt as dt_util
 
@@ -27,18 +32,71 @@ from .const import (
 )
 
 
-# Days mask bits (device convention): Sun=1, Mon=2, Tue=4, Wed=8, Thu=16, Fri=32, Sat=64
-_WEEKDAY_TO_BIT = [0x02, 0x04, 0x08, 0x10, 0x20, 0x40, 0x01]  # Mon..Sun
+# Periodic enforcement of schedule boundaries (and for thermostats that rarely emit updates).
+_TICK_INTERVAL_S = 60.0
 
+# Thermostats often emit bursts of updates (action, temperature, fan mode) together;
+# the first runs immediately, the rest collapse into one trailing evaluation.
+_CLIMATE_EVENT_COOLDOWN_S = 0.25
 
-def _parse_hhmm(value: str | None, default: str = "00:00") -> dtime:
-    s = (value or default or "00:00").strip()
-    try:
-        hh, mm = s.split(":", 1)
-        return dtime(hour=int(hh), minute=int(mm))
-    except Exception:
-        # Fallback to midnight
-        return dtime(hour=0, minute=0)
+# Persisting the manual snapshot is not urgent; coalesce rapid Sync toggles.
+_MANUAL_SNAPSHOT_SAVE_DELAY_S = 10.0
+
+# UI write handlers request an evaluation instead of awaiting one; requests arriving
+# within this window are collapsed into a single async_evaluate run.
+_EVALUATE_DEBOUNCE_S = 0.05
+
+class _AirflowMode(IntEnum):
+    """What counts as "air running"; indexes _AIRFLOW_ACTIONS."""
+
+    COOLING = 0
+    HEAT_COOL = 1
+    ANY = 2
+
+
+# hvac_action values accepted per airflow mode. "Any airflow" tries to catch
+# fan-only patterns across integrations.
+_AIRFLOW_ACTIONS: tuple[frozenset[str], ...] = (
+    frozenset({"cooling"}),
+    frozenset({"cooling", "heating"}),
+    frozenset({"cooling", "heating", "fan", "fan_only", "fan-only"}),
+)
+
+# Stored option value (incl. legacy spellings) -> airflow mode; unknown -> cooling only
+_AIRFLOW_MODE_ALIASES: dict[str, _AirflowMode] = {
+    "cooling_only": _AirflowMode.COOLING,
+    "cool_only": _AirflowMode.COOLING,
+    "cooling": _AirflowMode.COOLING,
+    "heat_cool": _AirflowMode.HEAT_COOL,
+    "heat+cool": _AirflowMode.HEAT_COOL,
+    "heat_cool_only": _AirflowMode.HEAT_COOL,
+    "heat_and_cool": _AirflowMode.HEAT_COOL,
+    "any_airflow": _AirflowMode.ANY,
+    "any": _AirflowMode.ANY,
+    "airflow": _AirflowMode.ANY,
+    "heat_cool_fan": _AirflowMode.ANY,
+}
+
+
+_HHMM_RE = re.compile(r"([01]?\d|2[0-3]):([0-5]?\d)")
+
+
+def _parse_hhmm(value: str | None, default: str = "00:00") -> int:
+    """Parse HH:MM into minutes since midnight (midnight if invalid)."""
+    m = _HHMM_RE.fullmatch((value or default or "00:00").strip())
+    if m is None:
+        return 0
+    return int(m[1]) * 60 + int(m[2])
+
+
+def _parse_schedule(
+    work_start: str | None, work_end: str | None, work_days_mask: int | None
+) -> tuple[int, str | None, str | None, int, int]:
+    """Normalize the diffuser Work schedule: (days_mask, start_s, end_s, start, end)."""
+    days_mask = int(work_days_mask or 0) & 0x7F
+    start_s = (work_start or "").strip() or None
+    end_s = (work_end or "").strip() or None
+    return days_mask, start_s, end_s, _parse_hhmm(start_s), _parse_hhmm(end_s)
 
 
 def _now_local(hass: HomeAssistant) -> datetime:
@@ -46,14 +104,15 @@ def _now_local(hass: HomeAssistant) -> datetime:
     return dt_util.now()
 
 
-def _in_schedule(now: datetime, *, days_mask: int, start: dtime, end: dtime) -> bool:
-    # Day check
-    bit = _WEEKDAY_TO_BIT[now.weekday()]
-    if not (days_mask & bit):
+def _in_schedule(now: datetime, *, days_mask: int, start: int, end: int) -> bool:
+    """Check `now` against the Work schedule (start/end in minutes since midnight)."""
+    # Day check. Days mask bits (device convention): Sun=1, Mon=2, ... Sat=64, and
+    # weekday() is Mon=0..Sun=6, so the bit index is (weekday + 1) % 7.
+    if not (days_mask & (1 << ((now.weekday() + 1) % 7))):
         return False
 
     # Time window check
-    t = now.timetz().replace(tzinfo=None)
+    t = now.hour * 60 + now.minute
     if start == end:
         # Treat as always-on for that day
         return True
@@ -81,38 +140,110 @@ def _hvac_action(state: State | None) -> str | None:
         return None
 
 
-def _is_airflow_active(state: State | None, mode: str) -> bool:
+def _is_off(state: State | None) -> bool:
+    """True when the thermostat itself is explicitly OFF."""
+    if state is None:
+        return False
+    try:
+        return str(state.state).strip().lower() == "off"
+    except Exception:
+        return False
+
+
+def _is_airflow_active(off: bool, act: str | None, mode: _AirflowMode) -> bool:
     """Decide if the HVAC is "running air" based on hvac_action.
 
     We intentionally use hvac_action (runtime state) vs hvac_mode (setpoint mode).
     """
     # Safety: if the thermostat is explicitly OFF, treat airflow as inactive even if
     # some integrations briefly keep a stale hvac_action.
-    if state is not None:
-        try:
-            if str(state.state).strip().lower() == "off":
-                return False
-        except Exception:
-            pass
-
-    act = _hvac_action(state)
-    if act is None:
+    if off or act is None:
         return False
+    return act in _AIRFLOW_ACTIONS[mode]
+
+
+@dataclass(frozen=True)
+class _Settings:
+    """HVAC Sync options, normalized once per options update."""
+
+    enabled: bool
+    climate_entity: str | None
+    airflow_mode: str
+    airflow: _AirflowMode
+    on_delay: int
+    off_delay: int
+
+
+def _settings_from_options(opts) -> _Settings:
+    airflow_mode = (
+        (opts.get(CONF_HVAC_SYNC_AIRFLOW_MODE) or DEFAULT_HVAC_SYNC_AIRFLOW_MODE).strip()
+        or DEFAULT_HVAC_SYNC_AIRFLOW_MODE
+    )
+    return _Settings(
+        enabled=bool(opts.get(CONF_HVAC_SYNC_ENABLED, DEFAULT_HVAC_SYNC_ENABLED)),
+        climate_entity=(opts.get(CONF_HVAC_SYNC_CLIMATE_ENTITY) or "").strip() or None,
+        airflow_mode=airflow_mode,
+        airflow=_AIRFLOW_MODE_ALIASES.get(airflow_mode.lower(), _AirflowMode.COOLING),
+        on_delay=int(opts.get(CONF_HVAC_SYNC_ON_DELAY_SECONDS, DEFAULT_HVAC_SYNC_ON_DELAY_SECONDS) or 0),
+        off_delay=int(opts.get(CONF_HVAC_SYNC_OFF_DELAY_SECONDS, DEFAULT_HVAC_SYNC_OFF_DELAY_SECONDS) or 0),
+    )
+
+
+@dataclass(slots=True)
+class _ManualSnapshot:
+    """Diffuser settings captured when HVAC Sync is turned on (restored when turned off)."""
+
+    device_id: str | None
+    captured_ts: float | None
+    power_on: bool | None
+    fan_on: bool | None
+    oil_name: str | None
+    work_start: str | None
+    work_end: str | None
+    work_run_s: int | None
+    work_stop_s: int | None
+    work_enabled: bool | None
+    work_days_mask: int | None
+
+    @classmethod
+    def from_dict(cls, data: Any) -> _ManualSnapshot | None:
+        """Load the stored layout (settings plus a nested "work" dict)."""
+        if not isinstance(data, dict):
+            return None
+        work = data.get("work")
+        if not isinstance(work, dict):
+            work = {}
+        return cls(
+            device_id=data.get("device_id"),
+            captured_ts=data.get("captured_ts"),
+            power_on=data.get("power_on"),
+            fan_on=data.get("fan_on"),
+            oil_name=data.get("oil_name"),
+            work_start=work.get("start"),
+            work_end=work.get("end"),
+            work_run_s=work.get("run_s"),
+            work_stop_s=work.get("stop_s"),
+            work_enabled=work.get("enabled"),
+            work_days_mask=work.get("days_mask"),
+        )
 
-    mode = (mode or "").strip().lower()
-
-    if mode in ("cooling_only", "cool_only", "cooling"):
-        return act == "cooling"
-
-    if mode in ("heat_cool", "heat+cool", "heat_cool_only", "heat_and_cool"):
-        return act in ("cooling", "heating")
-
-    # "Any airflow" tries to catch fan-only patterns across integrations.
-    if mode in ("any_airflow", "any", "airflow", "heat_cool_fan"):
-        return act in ("cooling", "heating", "fan", "fan_only", "fan-only")
-
-    # Unknown -> default to cooling-only
-    return act == "cooling"
+    def as_dict(self) -> dict[str, Any]:
+        """Stored layout; kept compatible with snapshots saved by older versions."""
+        return {
+            "device_id": self.device_id,
+            "captured_ts": self.captured_ts,
+            "power_on": self.power_on,
+            "fan_on": self.fan_on,
+            "oil_name": self.oil_name,
+            "work": {
+                "start": self.work_start,
+                "end": self.work_end,
+                "run_s": self.work_run_s,
+                "stop_s": self.work_stop_s,
+                "enabled": self.work_enabled,
+                "days_mask": self.work_days_mask,
+            },
+        }
 
 
 @dataclass
@@ -146,7 +277,7 @@ class FelshareHvacSyncController:
         # Persist the last known manual settings so we can restore them when HVAC Sync is turned off.
         # Stored per config entry (and survives HA restarts).
         self._manual_store: Store = Store(hass, 1, f"{DOMAIN}.manual_snapshot_{entry.entry_id}")
-        self._manual_snapshot: dict | None = None
+        self._manual_snapshot: _ManualSnapshot | None = None
         self._restore_pending: bool = False
         self._sync_params_pending: bool = False
         self._prev_enabled: bool | None = None
@@ -157,13 +288,43 @@ class FelshareHvacSyncController:
 
         self.status = HvacSyncStatus()
         self._unsub_state: Optional[Callable[[], None]] = None
-        self._unsub_timer: Optional[Callable[[], None]] = None
+        self._tick_handle: asyncio.TimerHandle | None = None
+        # Set by async_stop: an evaluation still suspended on an await must not re-arm
+        # timers or subscriptions against the unloaded entry when it resumes.
+        self._stopped = False
         self._unsub_pending: Optional[Callable[[], None]] = None
+        self._unsub_eval_request: Optional[Callable[[], None]] = None
+        self._eval_request_force: bool = False
         self._subscribed_entity: str | None = None
+        self._climate_debouncer = Debouncer(
+            hass,
+            self.logger,
+            cooldown=_CLIMATE_EVENT_COOLDOWN_S,
+            immediate=True,
+            function=self.async_evaluate,
+        )
+
+        # Normalized options; async_update_entry swaps in a new options mapping, so the
+        # snapshot is rebuilt whenever entry.options is a different object.
+        self._settings_opts = None
+        self._settings: _Settings | None = None
+
+        # Parsed Work schedule, keyed by the raw (start, end, days_mask) it was built from
+        self._sched_key: tuple | None = None
+        self._sched: tuple[int, str | None, str | None, int, int] | None = None
+
+        # Normalized (is_off, hvac_action) of the last climate State seen. HA creates a
+        # new State object on every change, so identity is a valid cache key.
+        self._climate_state: State | None = None
+        self._climate_off = False
+        self._climate_action: str | None = None
+
+        # Inputs of the last full evaluation (see async_evaluate)
+        self._last_fingerprint: tuple | None = None
 
         self._last_desired: bool | None = None
         self._pending_target: bool | None = None
-        self._pending_until: float | None = None
+        self._pending_until: float | None = None  # hass.loop.time() deadline
 
         # NOTE: manual controls are locked while HVAC Sync is ON (Option 2).
 
@@ -178,6 +339,8 @@ class FelshareHvacSyncController:
     def _arm_pending_timer(self, delay_s: float) -> None:
         """Ensure we wake up when a pending on/off delay expires."""
         self._cancel_pending_timer()
+        if self._stopped:
+            return
 
         # Never schedule negative; also avoid 0 which would call immediately and can recurse.
         delay_s = max(0.01, float(delay_s))
@@ -186,58 +349,75 @@ class FelshareHvacSyncController:
         def _due(_now) -> None:
             # Clear the handle first to avoid stale cancels.
             self._unsub_pending = None
-            # Force evaluation so we don't re-arm the same delay again.
-            self.hass.async_create_task(self.async_evaluate(force=True))
+            # Force evaluation so we don't re-arm the same delay again. Eager start runs
+            # it inline; a real Task is only left behind if it has to await a publish.
+            self.hass.async_create_task(self.async_evaluate(force=True), eager_start=True)
 
         self._unsub_pending = async_call_later(self.hass, delay_s, _due)
 
+    @callback
+    def async_request_evaluate(self, *, force: bool = False) -> None:
+        """Schedule a coalesced async_evaluate (used by entity write handlers)."""
+        self._eval_request_force = self._eval_request_force or force
+        if self._unsub_eval_request is not None or self._stopped:
+            return
+
+        @callback
+        def _run(_now) -> None:
+            self._unsub_eval_request = None
+            force_eval = self._eval_request_force
+            self._eval_request_force = False
+            self.hass.async_create_task(self.async_evaluate(force=force_eval), eager_start=True)
+
+        self._unsub_eval_request = async_call_later(self.hass, _EVALUATE_DEBOUNCE_S, _run)
+
     async def async_start(self) -> None:
         # Load last manual snapshot (if any)
         try:
-            data = await self._manual_store.async_load()
-            if isinstance(data, dict) and data.get("device_id"):
-                self._manual_snapshot = data
+            snap = _ManualSnapshot.from_dict(await self._manual_store.async_load())
+            if snap is not None and snap.device_id:
+                self._manual_snapshot = snap
         except Exception:
             self._manual_snapshot = None
 
         # Remember initial enabled state so first user toggle is treated as a transition.
-        self._prev_enabled = bool(self._opts().get(CONF_HVAC_SYNC_ENABLED, DEFAULT_HVAC_SYNC_ENABLED))
+        self._prev_enabled = self._get_settings().enabled
 
-        # Periodic enforcement for schedule boundaries (and in case climate doesn't emit updates)
-        self._unsub_timer = async_track_time_interval(self.hass, self._handle_tick, timedelta(seconds=60))
-        await self._ensure_subscription()
+        # Arms the periodic tick and the thermostat subscription as needed.
         await self.async_evaluate(force=True)
 
-    async def _async_save_manual_snapshot(self, snap: dict) -> None:
+    @callback
+    def _async_save_manual_snapshot(self, snap: _ManualSnapshot) -> None:
         self._manual_snapshot = snap
-        try:
-            await self._manual_store.async_save(snap)
-        except Exception:
-            # Best-effort persistence; continue anyway
-            pass
+        # Delayed save: repeated Sync toggles collapse into one write, and Store flushes
+        # pending data on HA shutdown.
+        self._manual_store.async_delay_save(self._manual_snapshot_data, _MANUAL_SNAPSHOT_SAVE_DELAY_S)
 
-    async def _async_capture_manual_snapshot(self) -> None:
+    @callback
+    def _manual_snapshot_data(self) -> dict:
+        return self._manual_snapshot.as_dict() if self._manual_snapshot is not None else {}
+
+    @callback
+    def _async_capture_manual_snapshot(self) -> None:
         """Capture the current diffuser settings as the "manual" baseline.
 
         Called when HVAC Sync transitions from OFF -> ON.
         """
         d = self.coordinator.data
-        snap = {
-            "device_id": getattr(d, "device_id", None),
-            "captured_ts": _now_local(self.hass).timestamp(),
-            "power_on": d.power_on,
-            "fan_on": d.fan_on,
-            "oil_name": d.oil_name,
-            "work": {
-                "start": d.work_start,
-                "end": d.work_end,
-                "run_s": d.work_run_s,
-                "stop_s": d.work_stop_s,
-                "enabled": d.work_enabled,
-                "days_mask": d.work_days_mask,
-            },
-        }
-        await self._async_save_manual_snapshot(snap)
+        snap = _ManualSnapshot(
+            device_id=d.device_id,
+            captured_ts=_now_local(self.hass).timestamp(),
+            power_on=d.power_on,
+            fan_on=d.fan_on,
+            oil_name=d.oil_name,
+            work_start=d.work_start,
+            work_end=d.work_end,
+            work_run_s=d.work_run_s,
+            work_stop_s=d.work_stop_s,
+            work_enabled=d.work_enabled,
+            work_days_mask=d.work_days_mask,
+        )
+        self._async_save_manual_snapshot(snap)
 
     async def _async_apply_forced_work_params(self) -> None:
         """Force Work run/stop cadence while HVAC Sync is enabled.
@@ -248,96 +428,101 @@ class FelshareHvacSyncController:
         """
 
         # If disconnected, postpone until we see a connected state again.
-        if not getattr(self.coordinator.data, "connected", False):
+        if not self.coordinator.data.connected:
             self._sync_params_pending = True
             return
 
         self._sync_params_pending = False
 
-        def _apply_blocking() -> None:
-            hub = self.coordinator.hub
+        # publish_* only enqueue into the hub outbox, so they are called directly.
+        try:
             # Only update run/stop (and keep work mode enabled while sync is active).
-            hub.publish_work_schedule(
+            self.coordinator.hub.publish_work_schedule(
                 run_s=int(HVAC_SYNC_FORCED_WORK_RUN_S),
                 stop_s=int(HVAC_SYNC_FORCED_WORK_STOP_S),
                 enabled=True,
             )
-
-        try:
-            await self.hass.async_add_executor_job(_apply_blocking)
         except Exception as e:
             self.status.last_reason = f"sync_params_error: {e}"
+            self._last_fingerprint = None  # retry on the next event/tick
             self.logger.warning("HVACSync could not apply forced work run/stop: %s", e)
 
     async def _async_restore_manual_snapshot(self) -> None:
         """Restore the last saved manual settings back to the device."""
         snap = self._manual_snapshot
-        if not isinstance(snap, dict):
+        if snap is None:
             # Try load on-demand
             try:
-                data = await self._manual_store.async_load()
-                if isinstance(data, dict):
-                    snap = data
-                    self._manual_snapshot = data
+                snap = _ManualSnapshot.from_dict(await self._manual_store.async_load())
+                if snap is not None:
+                    self._manual_snapshot = snap
             except Exception:
                 snap = None
 
-        if not isinstance(snap, dict):
+        if snap is None:
             return
 
         # If disconnected, postpone restore until we see a connected state again.
-        if not getattr(self.coordinator.data, "connected", False):
+        if not self.coordinator.data.connected:
             self._restore_pending = True
             return
 
         self._restore_pending = False
 
-        work = snap.get("work") if isinstance(snap.get("work"), dict) else {}
-        power_on = snap.get("power_on")
-        fan_on = snap.get("fan_on")
-        oil_name = snap.get("oil_name")
-
-        def _restore_blocking() -> None:
-            hub = self.coordinator.hub
-
-            # Restore schedule settings in a single WorkTime publish (avoids multiple MQTT writes).
-            hub.publish_work_schedule(
-                start=work.get("start"),
-                end=work.get("end"),
-                run_s=work.get("run_s"),
-                stop_s=work.get("stop_s"),
-                enabled=work.get("enabled"),
-                days_mask=work.get("days_mask"),
-            )
-
-            if oil_name is not None:
-                hub.publish_oil_name(str(oil_name))
-            if fan_on is not None:
-                hub.publish_fan(bool(fan_on))
-            if power_on is not None:
-                hub.publish_power(bool(power_on))
-
         try:
-            await self.hass.async_add_executor_job(_restore_blocking)
+            # Schedule settings go out in a single WorkTime publish (avoids multiple MQTT writes).
+            self.coordinator.hub.apply_state(
+                work_start=snap.work_start,
+                work_end=snap.work_end,
+                work_run_s=snap.work_run_s,
+                work_stop_s=snap.work_stop_s,
+                work_enabled=snap.work_enabled,
+                work_days_mask=snap.work_days_mask,
+                oil_name=snap.oil_name,
+                fan_on=snap.fan_on,
+                power_on=snap.power_on,
+            )
         except Exception as e:
             self.status.last_reason = f"restore_error: {e}"
             self.logger.warning("HVACSync restore failed: %s", e)
 
     async def async_stop(self) -> None:
+        self._stopped = True
         if self._unsub_state:
             self._unsub_state()
             self._unsub_state = None
-        if self._unsub_timer:
-            self._unsub_timer()
-            self._unsub_timer = None
+        if self._tick_handle:
+            self._tick_handle.cancel()
+            self._tick_handle = None
+        if self._unsub_eval_request:
+            self._unsub_eval_request()
+            self._unsub_eval_request = None
         self._cancel_pending_timer()
+        self._climate_debouncer.async_shutdown()
 
-    def _opts(self):
-        return self.entry.options
+    def _get_settings(self) -> _Settings:
+        opts = self.entry.options
+        if opts is not self._settings_opts or self._settings is None:
+            self._settings = _settings_from_options(opts)
+            self._settings_opts = opts
+        return self._settings
+
+    @callback
+    def _set_tick_active(self, active: bool) -> None:
+        """Run the periodic tick only while there is something to enforce."""
+        if active and not self._stopped:
+            if self._tick_handle is None:
+                # Periodic enforcement for schedule boundaries (and in case climate doesn't
+                # emit updates). A plain loop timer: the tick doesn't need the datetime an
+                # interval tracker builds.
+                self._tick_handle = self.hass.loop.call_later(_TICK_INTERVAL_S, self._handle_tick)
+        elif self._tick_handle is not None:
+            self._tick_handle.cancel()
+            self._tick_handle = None
 
-    async def _ensure_subscription(self) -> None:
-        entity = self._opts().get(CONF_HVAC_SYNC_CLIMATE_ENTITY) or None
-        if entity == self._subscribed_entity:
+    @callback
+    def _ensure_subscription(self, entity: str | None) -> None:
+        if entity == self._subscribed_entity or self._stopped:
             return
 
         # Unsubscribe old
@@ -357,20 +542,80 @@ class FelshareHvacSyncController:
 
     @callback
     def _handle_climate_event(self, event) -> None:
+        old_state: State | None = event.data.get("old_state")
+        new_state: State | None = event.data.get("new_state")
+        # Only the thermostat state and hvac_action feed the decision; ignore updates
+        # that just move temperatures/setpoints around.
+        if (
+            old_state is not None
+            and new_state is not None
+            and old_state.state == new_state.state
+            and _hvac_action(old_state) == _hvac_action(new_state)
+        ):
+            return
         # Evaluate ASAP when climate changes
-        self.hass.async_create_task(self.async_evaluate())
+        self._climate_debouncer.async_schedule_call()
 
     @callback
-    def _handle_tick(self, now) -> None:
-        self.hass.async_create_task(self.async_evaluate())
+    def _handle_tick(self) -> None:
+        if self._stopped:
+            self._tick_handle = None
+            return
+        self._tick_handle = self.hass.loop.call_later(_TICK_INTERVAL_S, self._handle_tick)
+        self.hass.async_create_task(self.async_evaluate(), eager_start=True)
+
+    def _canonical_climate(self, st: State | None) -> tuple[bool, str | None]:
+        if st is not self._climate_state:
+            self._climate_state = st
+            self._climate_off = _is_off(st)
+            self._climate_action = _hvac_action(st)
+        return self._climate_off, self._climate_action
 
     async def async_evaluate(self, *, force: bool = False) -> None:
-        await self._ensure_subscription()
+        settings = self._get_settings()
+        enabled = settings.enabled
+        climate_entity = settings.climate_entity
+        airflow_mode = settings.airflow_mode
 
-        opts = self._opts()
-        enabled = bool(opts.get(CONF_HVAC_SYNC_ENABLED, DEFAULT_HVAC_SYNC_ENABLED))
-        climate_entity = (opts.get(CONF_HVAC_SYNC_CLIMATE_ENTITY) or "").strip() or None
-        airflow_mode = (opts.get(CONF_HVAC_SYNC_AIRFLOW_MODE) or DEFAULT_HVAC_SYNC_AIRFLOW_MODE).strip() or DEFAULT_HVAC_SYNC_AIRFLOW_MODE
+        # Thermostat events only matter while HVAC Sync is enabled.
+        self._ensure_subscription(climate_entity if enabled else None)
+
+        d = self.coordinator.data
+        st = self.hass.states.get(climate_entity) if climate_entity else None
+        climate_off, hvac_action = self._canonical_climate(st)
+
+        # HVAC Sync schedule window is taken from the diffuser's own Work schedule.
+        sched_key = (d.work_start, d.work_end, d.work_days_mask)
+        if sched_key != self._sched_key:
+            self._sched_key = sched_key
+            self._sched = _parse_schedule(*sched_key)
+        days_mask, start_s, end_s, start, end = self._sched
+        schedule_ok = bool(start_s and end_s and days_mask)
+
+        # Wall-clock time is only needed for the schedule window; delays use the
+        # loop's monotonic clock.
+        now = _now_local(self.hass) if (enabled and schedule_ok) else None
+        now_ts = self.hass.loop.time()
+
+        # Everything the decision depends on; schedule boundaries are HH:MM so minute
+        # granularity is enough. Most ticks/events change none of it.
+        fingerprint = (
+            settings,
+            d.connected,
+            d.power_on,
+            d.work_enabled,
+            d.work_start,
+            d.work_end,
+            d.work_days_mask,
+            d.work_run_s,
+            d.work_stop_s,
+            climate_off,
+            hvac_action,
+            (now.day, now.hour, now.minute) if now is not None else None,
+        )
+        if not force and self._pending_until is None and fingerprint == self._last_fingerprint:
+            return
+        self._last_fingerprint = fingerprint
 
         # Track transitions to support:
         #  - OFF -> ON : capture a manual snapshot (persistent)
@@ -379,7 +624,7 @@ class FelshareHvacSyncController:
             self._prev_enabled = enabled
         elif enabled and not self._prev_enabled:
             # Capture baseline BEFORE HVAC Sync starts changing the device schedule.
-            await self._async_capture_manual_snapshot()
+            self._async_capture_manual_snapshot()
             # Force Work run/stop cadence while HVAC Sync is active.
             await self._async_apply_forced_work_params()
         elif (not enabled) and self._prev_enabled:
@@ -388,43 +633,32 @@ class FelshareHvacSyncController:
 
         # If HVAC Sync is disabled but we previously couldn't restore (device offline),
         # attempt restore once the device comes back online.
-        if (not enabled) and self._restore_pending and getattr(self.coordinator.data, "connected", False):
+        if (not enabled) and self._restore_pending and d.connected:
             await self._async_restore_manual_snapshot()
 
         # If HVAC Sync is enabled but we couldn't apply forced run/stop earlier (device offline),
         # retry once the device comes back online.
-        if enabled and self._sync_params_pending and getattr(self.coordinator.data, "connected", False):
+        if enabled and self._sync_params_pending and d.connected:
             await self._async_apply_forced_work_params()
 
         self._prev_enabled = enabled
-        # HVAC Sync schedule window is taken from the diffuser's own Work schedule.
-        d = self.coordinator.data
-        days_mask = int(d.work_days_mask or 0) & 0x7F
-        start_s = (d.work_start or "").strip() or None
-        end_s = (d.work_end or "").strip() or None
-        start = _parse_hhmm(start_s)
-        end = _parse_hhmm(end_s)
-
-        on_delay = int(opts.get(CONF_HVAC_SYNC_ON_DELAY_SECONDS, DEFAULT_HVAC_SYNC_ON_DELAY_SECONDS) or 0)
-        off_delay = int(opts.get(CONF_HVAC_SYNC_OFF_DELAY_SECONDS, DEFAULT_HVAC_SYNC_OFF_DELAY_SECONDS) or 0)
+        # While disabled, the tick is only kept to retry a postponed restore.
+        self._set_tick_active(enabled or self._restore_pending)
 
-        now = _now_local(self.hass)
-        now_ts = now.timestamp()
+        on_delay = settings.on_delay
+        off_delay = settings.off_delay
 
-        st = self.hass.states.get(climate_entity) if climate_entity else None
-        airflow_active = _is_airflow_active(st, airflow_mode)
-
-        schedule_ok = bool(start_s and end_s and days_mask)
+        airflow_active = _is_airflow_active(climate_off, hvac_action, settings.airflow)
 
         # Enforce forced run/stop values while HVAC Sync is enabled. This covers
         # cases where the user changes settings from the phone app while Sync is ON.
-        if enabled and schedule_ok and getattr(self.coordinator.data, "connected", False):
-            cur_run = getattr(d, "work_run_s", None)
-            cur_stop = getattr(d, "work_stop_s", None)
+        if enabled and schedule_ok and d.connected:
+            cur_run = d.work_run_s
+            cur_stop = d.work_stop_s
             if cur_run is not None and cur_stop is not None:
                 if int(cur_run) != int(HVAC_SYNC_FORCED_WORK_RUN_S) or int(cur_stop) != int(HVAC_SYNC_FORCED_WORK_STOP_S):
                     await self._async_apply_forced_work_params()
-        in_window = _in_schedule(now, days_mask=days_mask, start=start, end=end) if (enabled and schedule_ok) else False
+        in_window = _in_schedule(now, days_mask=days_mask, start=start, end=end) if now is not None else False
 
         self.logger.debug(
             "HVACSync eval: enabled=%s climate=%s hvac_action=%s airflow_mode=%s airflow_active=%s in_window=%s work_start=%s work_end=%s days_mask=0x%02X on_delay=%ss off_delay=%ss",
@@ -499,7 +733,7 @@ class FelshareHvacSyncController:
                     else:
                         self._pending_target = desired_now
                         self._pending_until = now_ts + float(delay)
-                        self.status.pending_until_ts = self._pending_until
+                        self.status.pending_until_ts = time.time() + float(delay)
                         self._arm_pending_timer(self._pending_until - now_ts)
                         self.logger.debug(
                             "HVACSync pending retargeted: target=%s apply_in=%.1fs reason=%s",
@@ -509,7 +743,6 @@ class FelshareHvacSyncController:
                         )
                         return
                 else:
-                    self.status.pending_until_ts = self._pending_until
                     self.logger.debug(
                         "HVACSync pending: target=%s apply_in=%.1fs reason=%s",
                         self._pending_target,
@@ -539,7 +772,7 @@ class FelshareHvacSyncController:
             if delay > 0:
                 self._pending_target = desired_now
                 self._pending_until = now_ts + float(delay)
-                self.status.pending_until_ts = self._pending_until
+                self.status.pending_until_ts = time.time() + float(delay)
                 self._arm_pending_timer(self._pending_until - now_ts)
                 self.logger.debug(
                     "HVACSync delayed: desired=%s delay=%ss reason=%s",
@@ -553,7 +786,7 @@ class FelshareHvacSyncController:
         self._last_desired = desired
 
         # Don't act if diffuser is disconnected
-        if not getattr(self.coordinator.data, "connected", False):
+        if not d.connected:
             return
 
         # IMPORTANT: Some Felshare models require Work schedule (work mode) to stay enabled,
@@ -562,8 +795,8 @@ class FelshareHvacSyncController:
         # Therefore HVAC Sync **never disables work mode**. We "gate" diffusion by toggling
         # the main Power switch instead.
 
-        current_work = getattr(self.coordinator.data, "work_enabled", None)
-        current_power = getattr(self.coordinator.data, "power_on", None)
+        current_work = d.work_enabled
+        current_power = d.power_on
         if current_power is None:
             # If unknown, avoid toggling aggressively.
             return
@@ -573,9 +806,10 @@ class FelshareHvacSyncController:
         if schedule_ok and current_work is False:
             try:
                 self.logger.info("HVACSync precondition: enabling Work schedule (required for Power control)")
-                await self.hass.async_add_executor_job(self.coordinator.hub.publish_work_enabled, True)
+                self.coordinator.hub.publish_work_enabled(True)
             except Exception as e:
                 self.status.last_reason = f"error: {e}"
+                self._last_fingerprint = None  # retry on the next event/tick
                 self.logger.warning("HVACSync could not enable Work schedule: %s", e)
                 # If we can't arm work mode, don't spam power toggles.
                 return
@@ -591,8 +825,9 @@ class FelshareHvacSyncController:
                 current_power,
                 reason,
             )
-            await self.hass.async_add_executor_job(self.coordinator.hub.publish_power, bool(desired))
-            self.status.last_action_ts = now_ts
+            self.coordinator.hub.publish_power(bool(desired))
+            self.status.last_action_ts = time.time()
         except Exception as e:
             self.status.last_reason = f"error: {e}"
+            self._last_fingerprint = None  # retry on the next event/tick
             self.logger.warning("HVACSync publish_power failed: %s", e)
@@ -1,18 +1,23 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Optional
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Optional
 
+if TYPE_CHECKING:
+    from .coordinator import FelshareCoordinator
+    from .hub import FelshareHub
+    from .hvac_sync import FelshareHvacSyncController
 
-@dataclass
+
+@dataclass(slots=True)
 class FelshareState:
     device_id: str
     connected: bool = False
 
     # Device -> cloud visibility
-    last_seen: Optional[datetime] = None
     last_seen_ts: Optional[float] = None
+    last_seen_mono: Optional[float] = None  # time.monotonic() (availability checks)
 
     # Outbound command visibility (diagnostics)
     last_publish_ts: Optional[float] = None
@@ -22,7 +27,7 @@ class FelshareState:
     # Last outbound TX (diagnostics)
     last_tx_ts: Optional[float] = None
     last_tx_key: Optional[str] = None
-    last_tx_payload_hex: Optional[str] = None
+    last_tx_payload: Optional[bytes] = None  # raw; formatted on read (last_tx_payload_hex)
     outbox_len: Optional[int] = None
 
     power_on: Optional[bool] = None
@@ -37,16 +42,49 @@ class FelshareState:
     # Work schedule ("WorkTime" / 0x32 0x01)
     work_start: Optional[str] = None  # "HH:MM"
     work_end: Optional[str] = None  # "HH:MM"
+    # Same times as (hour, minute), kept so WorkTime publishes don't re-parse our own strings
+    work_start_hm: Optional[tuple[int, int]] = None
+    work_end_hm: Optional[tuple[int, int]] = None
     work_run_s: Optional[int] = None
     work_stop_s: Optional[int] = None
     work_enabled: Optional[bool] = None
-    # Device mapping: Sun=1, Mon=2, Tue=4, Wed=8, Thu=16, Fri=32, Sat=64
+    # Device mapping: Sun=1, Mon=2, Tue=4, Wed=8, Thu=16, Fri=32, Sat=64.
+    # Always a plain int in 0..0x7F once known; readers don't need to re-cast it.
     work_days_mask: Optional[int] = None
     work_flag_raw: Optional[int] = None  # raw flag byte (0..255)
     work_days: Optional[str] = None  # human-friendly ("Mon,Tue,...")
+    work_days_display: Optional[str] = None  # summary form ("Mon Tue ...")
 
     last_topic: Optional[str] = None
-    last_payload_hex: Optional[str] = None
+    last_payload: Optional[bytes] = None  # raw; formatted on read (last_payload_hex)
 
     # Last error (best-effort, diagnostics)
     last_error: Optional[str] = None
+
+    # Diagnostics derived on read, so the MQTT thread doesn't format them per frame
+    @property
+    def last_seen(self) -> Optional[datetime]:
+        if self.last_seen_ts is None:
+            return None
+        return datetime.fromtimestamp(self.last_seen_ts, tz=timezone.utc)
+
+    @property
+    def last_payload_hex(self) -> Optional[str]:
+        if self.last_payload is None:
+            return None
+        return self.last_payload.hex(" ", 1)
+
+    @property
+    def last_tx_payload_hex(self) -> Optional[str]:
+        if self.last_tx_payload is None:
+            return None
+        return self.last_tx_payload.hex(" ", 1)
+
+
+@dataclass(slots=True)
+class FelshareRuntimeData:
+    """Per-entry objects, stored on ConfigEntry.runtime_data."""
+
+    hub: FelshareHub
+    coordinator: FelshareCoordinator
+    hvac_sync: FelshareHvacSyncController
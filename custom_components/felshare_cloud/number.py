@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from operator import attrgetter
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -7,7 +9,6 @@ from homeassistant.components.number import NumberEntity, NumberMode
 from homeassistant.exceptions import HomeAssistantError
 
 from .const import (
-    DOMAIN,
     CONF_HVAC_SYNC_ON_DELAY_SECONDS,
     CONF_HVAC_SYNC_OFF_DELAY_SECONDS,
     DEFAULT_HVAC_SYNC_ON_DELAY_SECONDS,
@@ -18,11 +19,11 @@ from .entity import FelshareEntity
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback) -> None:
-    coordinator: FelshareCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    coordinator: FelshareCoordinator = entry.runtime_data.coordinator
     dev = coordinator.data.device_id
 
     async_add_entities(
-        [
+        (
             FelshareConsumptionNumber(coordinator, entry, dev),
             FelshareCapacityNumber(coordinator, entry, dev),
             FelshareRemainOilNumber(coordinator, entry, dev),
@@ -30,20 +31,47 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
             FelshareWorkStopSecondsNumber(coordinator, entry, dev),
             FelshareHvacSyncOnDelaySecondsNumber(coordinator, entry, dev),
             FelshareHvacSyncOffDelaySecondsNumber(coordinator, entry, dev),
-        ]
+        ),
+        update_before_add=False,
     )
 
 
-class _BaseHvacSyncDelayNumber(FelshareEntity, NumberEntity):
+class _FelshareNumberBase(FelshareEntity, NumberEntity):
+    """Shared attributes for all Felshare number entities."""
+
+    _attr_has_entity_name = True
     # Intentionally not EntityCategory.CONFIG so HA doesn't group everything under
     # the device "Configuration" section.
     _attr_entity_category = None
-    _attr_native_unit_of_measurement = "s"
     _attr_mode = NumberMode.BOX
     _attr_native_min_value = 0
-    _attr_native_max_value = 900
     _attr_native_step = 1
 
+    # Device-backed numbers: hub method to call, value conversion, and whether the
+    # control is locked while HVAC Sync is enabled.
+    _get_value: attrgetter
+    _publish_attr: str
+    _publish_cast: type = int
+    _hvac_sync_locked: bool = False
+
+    async def async_set_native_value(self, value: float) -> None:
+        if self._hvac_sync_locked:
+            self._raise_if_hvac_sync_locked()
+        new_value = self._publish_cast(value)
+        if self.coordinator.data.connected and self._get_value(self) == new_value:
+            # Already reported by the (connected) device, e.g. repeated box posts: nothing
+            # to send. Offline writes still take the publish path and its error.
+            return
+        try:
+            await getattr(self.coordinator.hub, self._publish_attr)(new_value)
+        except Exception as e:
+            raise HomeAssistantError(str(e))
+
+
+class _BaseHvacSyncDelayNumber(_FelshareNumberBase):
+    _attr_native_unit_of_measurement = "s"
+    _attr_native_max_value = 900
+
     _key: str
     _default: int
 
@@ -51,182 +79,117 @@ class _BaseHvacSyncDelayNumber(FelshareEntity, NumberEntity):
     def native_value(self):
         try:
             return int(self._entry.options.get(self._key, self._default) or 0)
-        except Exception:
-            return int(self._default)
+        except (TypeError, ValueError):
+            return self._default
 
     async def async_set_native_value(self, value: float) -> None:
-        new_opts = dict(self._entry.options)
-        new_opts[self._key] = int(value)
-        self.hass.config_entries.async_update_entry(self._entry, options=new_opts)
+        new_value = int(value)
+        if self._entry.options.get(self._key, self._default) == new_value:
+            # Unchanged: skip the options write, re-evaluation and state write.
+            return
+        self._update_entry(self._entry, options={**self._entry.options, self._key: new_value})
 
-        ctl = self.hass.data.get(DOMAIN, {}).get(self._entry.entry_id, {}).get("hvac_sync")
-        if ctl is not None:
-            await ctl.async_evaluate(force=True)
+        self._request_hvac_sync_evaluate()
         self.async_write_ha_state()
 
 
 class FelshareHvacSyncOnDelaySecondsNumber(_BaseHvacSyncDelayNumber):
-    _attr_has_entity_name = True
     _attr_name = "HVAC sync on delay (seconds)"
     _attr_suggested_object_id = "94_hvac_sync_on_delay_s"
     _attr_icon = "mdi:timer-play-outline"
 
     _key = CONF_HVAC_SYNC_ON_DELAY_SECONDS
     _default = DEFAULT_HVAC_SYNC_ON_DELAY_SECONDS
-
-    def __init__(self, coordinator: FelshareCoordinator, entry: ConfigEntry, dev: str) -> None:
-        super().__init__(coordinator, entry, dev)
-        self._attr_unique_id = f"{self._entry_id}_{dev}_hvac_sync_on_delay_s"
+    _uid_suffix = "hvac_sync_on_delay_s"
 
 
 class FelshareHvacSyncOffDelaySecondsNumber(_BaseHvacSyncDelayNumber):
-    _attr_has_entity_name = True
     _attr_name = "HVAC sync off delay (seconds)"
     _attr_suggested_object_id = "95_hvac_sync_off_delay_s"
     _attr_icon = "mdi:timer-stop-outline"
 
     _key = CONF_HVAC_SYNC_OFF_DELAY_SECONDS
     _default = DEFAULT_HVAC_SYNC_OFF_DELAY_SECONDS
+    _uid_suffix = "hvac_sync_off_delay_s"
 
-    def __init__(self, coordinator: FelshareCoordinator, entry: ConfigEntry, dev: str) -> None:
-        super().__init__(coordinator, entry, dev)
-        self._attr_unique_id = f"{self._entry_id}_{dev}_hvac_sync_off_delay_s"
 
-
-class FelshareConsumptionNumber(FelshareEntity, NumberEntity):
-    _attr_has_entity_name = True
+class FelshareConsumptionNumber(_FelshareNumberBase):
     _attr_name = "Consumption"
-    _attr_entity_category = None
     _attr_suggested_object_id = "consumption"
     _attr_native_unit_of_measurement = "ml/h"
     _attr_icon = "mdi:water"
-    _attr_mode = NumberMode.BOX
     _attr_native_min_value = 0.0
     _attr_native_max_value = 200.0
     _attr_native_step = 0.1
-
-    def __init__(self, coordinator: FelshareCoordinator, entry: ConfigEntry, dev: str) -> None:
-        super().__init__(coordinator, entry, dev)
-        self._attr_unique_id = f"{self._entry_id}_{dev}_consumption"
+    _uid_suffix = "consumption"
+    _get_value = attrgetter("coordinator.data.consumption")
+    _publish_attr = "async_publish_consumption"
+    _publish_cast = float
 
     @property
     def native_value(self):
-        return self.coordinator.data.consumption
-
-    async def async_set_native_value(self, value: float) -> None:
-        try:
-            await self.hass.async_add_executor_job(self.coordinator.hub.publish_consumption, float(value))
-        except Exception as e:
-            raise HomeAssistantError(str(e))
+        return self._get_value(self)
 
 
-class FelshareCapacityNumber(FelshareEntity, NumberEntity):
-    _attr_has_entity_name = True
+class FelshareCapacityNumber(_FelshareNumberBase):
     _attr_name = "Oil capacity"
-    _attr_entity_category = None
     _attr_suggested_object_id = "capacity"
     _attr_native_unit_of_measurement = "ml"
     _attr_icon = "mdi:cup-water"
-    _attr_mode = NumberMode.BOX
-    _attr_native_min_value = 0
     _attr_native_max_value = 5000
-    _attr_native_step = 1
-
-    def __init__(self, coordinator: FelshareCoordinator, entry: ConfigEntry, dev: str) -> None:
-        super().__init__(coordinator, entry, dev)
-        self._attr_unique_id = f"{self._entry_id}_{dev}_capacity"
+    _uid_suffix = "capacity"
+    _get_value = attrgetter("coordinator.data.capacity")
+    _publish_attr = "async_publish_capacity"
 
     @property
     def native_value(self):
-        return self.coordinator.data.capacity
-
-    async def async_set_native_value(self, value: float) -> None:
-        try:
-            await self.hass.async_add_executor_job(self.coordinator.hub.publish_capacity, int(value))
-        except Exception as e:
-            raise HomeAssistantError(str(e))
+        return self._get_value(self)
 
 
-class FelshareRemainOilNumber(FelshareEntity, NumberEntity):
-    _attr_has_entity_name = True
+class FelshareRemainOilNumber(_FelshareNumberBase):
     _attr_name = "Remaining oil"
-    _attr_entity_category = None
     _attr_suggested_object_id = "remain_oil"
     _attr_native_unit_of_measurement = "ml"
     _attr_icon = "mdi:cup-water"
-    _attr_mode = NumberMode.BOX
-    _attr_native_min_value = 0
     _attr_native_max_value = 5000
-    _attr_native_step = 1
-
-    def __init__(self, coordinator: FelshareCoordinator, entry: ConfigEntry, dev: str) -> None:
-        super().__init__(coordinator, entry, dev)
-        self._attr_unique_id = f"{self._entry_id}_{dev}_remain_oil"
+    _uid_suffix = "remain_oil"
+    _get_value = attrgetter("coordinator.data.remain_oil")
+    _publish_attr = "async_publish_remain_oil"
 
     @property
     def native_value(self):
-        return self.coordinator.data.remain_oil
-
-    async def async_set_native_value(self, value: float) -> None:
-        try:
-            await self.hass.async_add_executor_job(self.coordinator.hub.publish_remain_oil, int(value))
-        except Exception as e:
-            raise HomeAssistantError(str(e))
+        return self._get_value(self)
 
 
-class FelshareWorkRunSecondsNumber(FelshareEntity, NumberEntity):
-    _attr_has_entity_name = True
+class FelshareWorkRunSecondsNumber(_FelshareNumberBase):
     _attr_name = "Work run (seconds)"
-    _attr_entity_category = None
     _attr_suggested_object_id = "03_work_run_s"
     _attr_native_unit_of_measurement = "s"
     _attr_icon = "mdi:timer-outline"
-    _attr_mode = NumberMode.BOX
-    _attr_native_min_value = 0
     # Device limitation: 0..999 seconds
     _attr_native_max_value = 999
-    _attr_native_step = 1
-
-    def __init__(self, coordinator: FelshareCoordinator, entry: ConfigEntry, dev: str) -> None:
-        super().__init__(coordinator, entry, dev)
-        self._attr_unique_id = f"{self._entry_id}_{dev}_work_run_s"
+    _uid_suffix = "work_run_s"
+    _get_value = attrgetter("coordinator.data.work_run_s")
+    _publish_attr = "async_publish_work_run_s"
+    _hvac_sync_locked = True
 
     @property
     def native_value(self):
-        return self.coordinator.data.work_run_s
-
-    async def async_set_native_value(self, value: float) -> None:
-        self._raise_if_hvac_sync_locked()
-        try:
-            await self.hass.async_add_executor_job(self.coordinator.hub.publish_work_run_s, int(value))
-        except Exception as e:
-            raise HomeAssistantError(str(e))
+        return self._get_value(self)
 
 
-class FelshareWorkStopSecondsNumber(FelshareEntity, NumberEntity):
-    _attr_has_entity_name = True
+class FelshareWorkStopSecondsNumber(_FelshareNumberBase):
     _attr_name = "Work stop (seconds)"
-    _attr_entity_category = None
     _attr_suggested_object_id = "04_work_stop_s"
     _attr_native_unit_of_measurement = "s"
     _attr_icon = "mdi:timer-off-outline"
-    _attr_mode = NumberMode.BOX
-    _attr_native_min_value = 0
     # Device limitation: 0..999 seconds
     _attr_native_max_value = 999
-    _attr_native_step = 1
-
-    def __init__(self, coordinator: FelshareCoordinator, entry: ConfigEntry, dev: str) -> None:
-        super().__init__(coordinator, entry, dev)
-        self._attr_unique_id = f"{self._entry_id}_{dev}_work_stop_s"
+    _uid_suffix = "work_stop_s"
+    _get_value = attrgetter("coordinator.data.work_stop_s")
+    _publish_attr = "async_publish_work_stop_s"
+    _hvac_sync_locked = True
 
     @property
     def native_value(self):
-        return self.coordinator.data.work_stop_s
-
-    async def async_set_native_value(self, value: float) -> None:
-        self._raise_if_hvac_sync_locked()
-        try:
-            await self.hass.async_add_executor_job(self.coordinator.hub.publish_work_stop_s, int(value))
-        except Exception as e:
-            raise HomeAssistantError(str(e))
+        return self._get_value(self)
@@ -6,7 +6,6 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import (
-    DOMAIN,
     CONF_HVAC_SYNC_CLIMATE_ENTITY,
     CONF_HVAC_SYNC_AIRFLOW_MODE,
     DEFAULT_HVAC_SYNC_AIRFLOW_MODE,
@@ -17,19 +16,30 @@ from .entity import FelshareEntity
 
 _NONE = "(none)"
 
+# HVAC Sync airflow mode: UI label <-> stored option value
+_LABEL_TO_MODE: dict[str, str] = {
+    "Cooling only": "cooling_only",
+    "Heat + Cool": "heat_cool",
+    "Any airflow (Heat/Cool/Fan)": "any_airflow",
+}
+_MODE_TO_LABEL: dict[str, str] = {v: k for k, v in _LABEL_TO_MODE.items()}
+_AIRFLOW_OPTIONS: list[str] = list(_LABEL_TO_MODE)
+_FALLBACK_AIRFLOW_LABEL = _MODE_TO_LABEL.get(DEFAULT_HVAC_SYNC_AIRFLOW_MODE, "Cooling only")
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
-    coordinator: FelshareCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    coordinator: FelshareCoordinator = entry.runtime_data.coordinator
     dev = coordinator.data.device_id
     async_add_entities(
-        [
+        (
             FelshareHvacThermostatSelect(coordinator, entry, dev),
             FelshareHvacAirflowModeSelect(coordinator, entry, dev),
-        ]
+        ),
+        update_before_add=False,
     )
 
 
@@ -41,10 +51,7 @@ class FelshareHvacThermostatSelect(FelshareEntity, SelectEntity):
     _attr_entity_category = None
     _attr_icon = "mdi:thermostat"
     _attr_suggested_object_id = "90_hvac_sync_thermostat"
-
-    def __init__(self, coordinator: FelshareCoordinator, entry: ConfigEntry, dev: str) -> None:
-        super().__init__(coordinator, entry, dev)
-        self._attr_unique_id = f"{self._entry_id}_{dev}_hvac_sync_thermostat"
+    _uid_suffix = "hvac_sync_thermostat"
 
     @property
     def options(self) -> list[str]:
@@ -55,18 +62,16 @@ class FelshareHvacThermostatSelect(FelshareEntity, SelectEntity):
 
     @property
     def current_option(self) -> str | None:
-        sel = (self._entry.options.get(CONF_HVAC_SYNC_CLIMATE_ENTITY) or "").strip()
-        return sel if sel else _NONE
+        return self._entry.options.get(CONF_HVAC_SYNC_CLIMATE_ENTITY) or _NONE
 
     async def async_select_option(self, option: str) -> None:
-        new_opts = dict(self._entry.options)
-        new_opts[CONF_HVAC_SYNC_CLIMATE_ENTITY] = "" if option == _NONE else option
-        self.hass.config_entries.async_update_entry(self._entry, options=new_opts)
+        entity_id = "" if option == _NONE else option
+        if (self._entry.options.get(CONF_HVAC_SYNC_CLIMATE_ENTITY) or "") == entity_id:
+            return
+        self._update_entry(self._entry, options={**self._entry.options, CONF_HVAC_SYNC_CLIMATE_ENTITY: entity_id})
 
         # Poke controller for immediate effect
-        ctl = self.hass.data.get(DOMAIN, {}).get(self._entry.entry_id, {}).get("hvac_sync")
-        if ctl is not None:
-            await ctl.async_evaluate(force=True)
+        self._request_hvac_sync_evaluate()
 
         self.async_write_ha_state()
 
@@ -83,35 +88,20 @@ class FelshareHvacAirflowModeSelect(FelshareEntity, SelectEntity):
     _attr_entity_category = None
     _attr_icon = "mdi:fan-auto"
     _attr_suggested_object_id = "88_hvac_sync_airflow"
-
-    _LABEL_TO_MODE = {
-        "Cooling only": "cooling_only",
-        "Heat + Cool": "heat_cool",
-        "Any airflow (Heat/Cool/Fan)": "any_airflow",
-    }
-    _MODE_TO_LABEL = {v: k for k, v in _LABEL_TO_MODE.items()}
-
-    def __init__(self, coordinator: FelshareCoordinator, entry: ConfigEntry, dev: str) -> None:
-        super().__init__(coordinator, entry, dev)
-        self._attr_unique_id = f"{self._entry_id}_{dev}_hvac_sync_airflow_mode"
-
-    @property
-    def options(self) -> list[str]:
-        return list(self._LABEL_TO_MODE.keys())
+    _attr_options = _AIRFLOW_OPTIONS
+    _uid_suffix = "hvac_sync_airflow_mode"
 
     @property
     def current_option(self) -> str | None:
-        mode = (self._entry.options.get(CONF_HVAC_SYNC_AIRFLOW_MODE) or DEFAULT_HVAC_SYNC_AIRFLOW_MODE).strip() or DEFAULT_HVAC_SYNC_AIRFLOW_MODE
-        return self._MODE_TO_LABEL.get(mode, self._MODE_TO_LABEL.get(DEFAULT_HVAC_SYNC_AIRFLOW_MODE, "Cooling only"))
+        mode = self._entry.options.get(CONF_HVAC_SYNC_AIRFLOW_MODE) or DEFAULT_HVAC_SYNC_AIRFLOW_MODE
+        return _MODE_TO_LABEL.get(mode, _FALLBACK_AIRFLOW_LABEL)
 
     async def async_select_option(self, option: str) -> None:
-        mode = self._LABEL_TO_MODE.get(option, DEFAULT_HVAC_SYNC_AIRFLOW_MODE)
-        new_opts = dict(self._entry.options)
-        new_opts[CONF_HVAC_SYNC_AIRFLOW_MODE] = mode
-        self.hass.config_entries.async_update_entry(self._entry, options=new_opts)
-
-        ctl = self.hass.data.get(DOMAIN, {}).get(self._entry.entry_id, {}).get("hvac_sync")
-        if ctl is not None:
-            await ctl.async_evaluate(force=True)
+        mode = _LABEL_TO_MODE.get(option, DEFAULT_HVAC_SYNC_AIRFLOW_MODE)
+        if self._entry.options.get(CONF_HVAC_SYNC_AIRFLOW_MODE, DEFAULT_HVAC_SYNC_AIRFLOW_MODE) == mode:
+            return
+        self._update_entry(self._entry, options={**self._entry.options, CONF_HVAC_SYNC_AIRFLOW_MODE: mode})
+
+        self._request_hvac_sync_evaluate()
 
         self.async_write_ha_state()
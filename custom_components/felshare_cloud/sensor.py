@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from operator import attrgetter
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
@@ -8,7 +9,6 @@ from homeassistant.const import PERCENTAGE, EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.components.sensor import SensorEntity
 
-from .const import DOMAIN
 from .coordinator import FelshareCoordinator
 from .entity import FelshareEntity
 
@@ -18,47 +18,47 @@ def _iso_from_ts(ts: float | None) -> str | None:
         return None
     try:
         return datetime.fromtimestamp(ts, tz=timezone.utc).isoformat()
-    except Exception:
+    except (OverflowError, OSError, ValueError):
         return None
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback) -> None:
-    coordinator: FelshareCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    coordinator: FelshareCoordinator = entry.runtime_data.coordinator
     dev = coordinator.data.device_id
 
     async_add_entities(
-        [
+        (
             FelshareLiquidLevelSensor(coordinator, entry, dev),
             FelshareMqttStatusSensor(coordinator, entry, dev),
             FelshareWorkScheduleSensor(coordinator, entry, dev),
-        ]
+        ),
+        update_before_add=False,
     )
 
 
-class FelshareLiquidLevelSensor(FelshareEntity, SensorEntity):
+class _FelshareSensorBase(FelshareEntity, SensorEntity):
+    """Shared attributes for all Felshare sensor entities."""
+
     _attr_has_entity_name = True
+
+
+class FelshareLiquidLevelSensor(_FelshareSensorBase):
     _attr_name = "Liquid level"
     _attr_native_unit_of_measurement = PERCENTAGE
     _attr_icon = "mdi:gauge"
-
-    def __init__(self, coordinator: FelshareCoordinator, entry: ConfigEntry, dev: str) -> None:
-        super().__init__(coordinator, entry, dev)
-        self._attr_unique_id = f"{self._entry_id}_{dev}_liquid_level"
+    _uid_suffix = "liquid_level"
+    _get_value = attrgetter("coordinator.data.liquid_level")
 
     @property
     def native_value(self):
-        return self.coordinator.data.liquid_level
+        return self._get_value(self)
 
 
-class FelshareMqttStatusSensor(FelshareEntity, SensorEntity):
-    _attr_has_entity_name = True
+class FelshareMqttStatusSensor(_FelshareSensorBase):
     _attr_name = "MQTT status"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_icon = "mdi:cloud-check"
-
-    def __init__(self, coordinator: FelshareCoordinator, entry: ConfigEntry, dev: str) -> None:
-        super().__init__(coordinator, entry, dev)
-        self._attr_unique_id = f"{self._entry_id}_{dev}_mqtt_status"
+    _uid_suffix = "mqtt_status"
 
     @property
     def native_value(self):
@@ -68,14 +68,15 @@ class FelshareMqttStatusSensor(FelshareEntity, SensorEntity):
     def extra_state_attributes(self):
         d = self.coordinator.data
         hub = getattr(self.coordinator, "hub", None)
-        hvac_sync = self.hass.data.get(DOMAIN, {}).get(self._entry.entry_id, {}).get("hvac_sync")
+        hvac_sync = self._hvac_ctl
         hvac_status = getattr(hvac_sync, "status", None) if hvac_sync else None
         manual_snap = getattr(hvac_sync, "_manual_snapshot", None) if hvac_sync else None
-        manual_ts = manual_snap.get("captured_ts") if isinstance(manual_snap, dict) else None
+        manual_ts = getattr(manual_snap, "captured_ts", None)
+        last_seen_iso = _iso_from_ts(d.last_seen_ts)
         return {
-            "last_seen": d.last_seen.replace(tzinfo=timezone.utc).isoformat() if d.last_seen else None,
+            "last_seen": last_seen_iso,
             "last_seen_ts": d.last_seen_ts,
-            "last_seen_utc": _iso_from_ts(d.last_seen_ts),
+            "last_seen_utc": last_seen_iso,
 
             "last_publish_ts": d.last_publish_ts,
             "last_publish_utc": _iso_from_ts(d.last_publish_ts),
@@ -123,15 +124,11 @@ class FelshareMqttStatusSensor(FelshareEntity, SensorEntity):
         }
 
 
-class FelshareWorkScheduleSensor(FelshareEntity, SensorEntity):
-    _attr_has_entity_name = True
+class FelshareWorkScheduleSensor(_FelshareSensorBase):
     _attr_name = "Work schedule info"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_icon = "mdi:calendar-clock"
-
-    def __init__(self, coordinator: FelshareCoordinator, entry: ConfigEntry, dev: str) -> None:
-        super().__init__(coordinator, entry, dev)
-        self._attr_unique_id = f"{self._entry_id}_{dev}_work_schedule"
+    _uid_suffix = "work_schedule"
 
     @property
     def native_value(self):
@@ -139,13 +136,10 @@ class FelshareWorkScheduleSensor(FelshareEntity, SensorEntity):
         if not d.work_start or not d.work_end:
             return None
 
-        days = (d.work_days or "-").replace(",", " ")
-        enabled = "ON" if d.work_enabled else "OFF"
-
-        parts = [f"{d.work_start}–{d.work_end}", days, enabled]
+        base = f"{d.work_start}–{d.work_end} | {d.work_days_display or '-'} | {'ON' if d.work_enabled else 'OFF'}"
         if d.work_run_s is not None and d.work_stop_s is not None:
-            parts.append(f"run {d.work_run_s}s / stop {d.work_stop_s}s")
-        return " | ".join(parts)
+            return f"{base} | run {d.work_run_s}s / stop {d.work_stop_s}s"
+        return base
 
     @property
     def extra_state_attributes(self):
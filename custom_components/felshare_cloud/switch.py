@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-import functools
+import asyncio
+from operator import attrgetter
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
@@ -9,7 +10,6 @@ from homeassistant.components.switch import SwitchEntity
 from homeassistant.exceptions import HomeAssistantError
 
 from .const import (
-    DOMAIN,
     CONF_HVAC_SYNC_ENABLED,
     CONF_HVAC_SYNC_CLIMATE_ENTITY,
     DEFAULT_HVAC_SYNC_ENABLED,
@@ -18,15 +18,20 @@ from .coordinator import FelshareCoordinator
 from .entity import FelshareEntity
 
 # Work days bitmask (device): Sun=1, Mon=2, Tue=4, Wed=8, Thu=16, Fri=32, Sat=64
-_DAYS = [
-    ("mon", "Monday", 0x02),
-    ("tue", "Tuesday", 0x04),
-    ("wed", "Wednesday", 0x08),
-    ("thu", "Thursday", 0x10),
-    ("fri", "Friday", 0x20),
-    ("sat", "Saturday", 0x40),
-    ("sun", "Sunday", 0x01),
-]
+# (unique_id suffix, entity name, bit, inverse bit within 0x7F, suggested object id),
+# built once at import.
+_DAYS: tuple[tuple[str, str, int, int, str], ...] = tuple(
+    (f"work_day_{key}", f"Work day {label}", bit, 0x7F ^ bit, f"05_work_day_{key}")
+    for key, label, bit in (
+        ("mon", "Monday", 0x02),
+        ("tue", "Tuesday", 0x04),
+        ("wed", "Wednesday", 0x08),
+        ("thu", "Thursday", 0x10),
+        ("fri", "Friday", 0x20),
+        ("sat", "Saturday", 0x40),
+        ("sun", "Sunday", 0x01),
+    )
+)
 
 
 async def async_setup_entry(
@@ -34,7 +39,7 @@ async def async_setup_entry(
     entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
-    coordinator: FelshareCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    coordinator: FelshareCoordinator = entry.runtime_data.coordinator
     dev = coordinator.data.device_id
 
     entities: list[SwitchEntity] = [
@@ -44,121 +49,84 @@ async def async_setup_entry(
         FelshareWorkEnabledSwitch(coordinator, entry, dev),
         # HVAC Sync controls (dashboard-friendly)
         FelshareHvacSyncEnabledSwitch(coordinator, entry, dev),
-    ]
-
-    # Add 7 day toggles
-    for key, label, bit in _DAYS:
-        entities.append(
+        # 7 day toggles
+        *[
             FelshareWorkDaySwitch(
-                coordinator,
-                entry,
-                dev,
-                key=key,
-                label=label,
-                bit=bit,
+                coordinator, entry, dev, uid_suffix=uid_suffix, name=name, bit=bit, inv_bit=inv_bit, object_id=object_id
             )
-        )
+            for uid_suffix, name, bit, inv_bit, object_id in _DAYS
+        ],
+    ]
 
-    async_add_entities(entities)
+    async_add_entities(entities, update_before_add=False)
 
     # NOTE: Older versions exposed separate HVAC Sync day toggles. As of 0.1.6.10,
     # HVAC Sync reuses the diffuser Work schedule (days + start/end) to avoid duplicates.
 
 
-class FelsharePowerSwitch(FelshareEntity, SwitchEntity):
-    _attr_has_entity_name = True
-    _attr_name = "Power"
-    _attr_suggested_object_id = "power"
-    _attr_icon = "mdi:power"
+class _FelshareDeviceSwitchBase(FelshareEntity, SwitchEntity):
+    """Shared behavior for switches backed by a device flag published over MQTT."""
 
-    def __init__(self, coordinator: FelshareCoordinator, entry: ConfigEntry, dev: str) -> None:
-        super().__init__(coordinator, entry, dev)
-        self._attr_unique_id = f"{self._entry_id}_{dev}_power"
+    _attr_has_entity_name = True
+    _get_value: attrgetter
+    _publish_attr: str
+    # Work schedule flags also drive HVAC Sync's schedule window
+    _evaluate_hvac_sync = False
 
     @property
     def is_on(self) -> bool | None:
-        return self.coordinator.data.power_on
+        return self._get_value(self)
 
     async def async_turn_on(self, **kwargs) -> None:
-        self._raise_if_hvac_sync_locked()
-        try:
-            await self.hass.async_add_executor_job(self.coordinator.hub.publish_power, True)
-        except Exception as e:
-            raise HomeAssistantError(str(e))
+        await self._async_set(True)
 
     async def async_turn_off(self, **kwargs) -> None:
+        await self._async_set(False)
+
+    async def _async_set(self, on: bool) -> None:
         self._raise_if_hvac_sync_locked()
+        if not self.coordinator.data.connected:
+            raise HomeAssistantError("MQTT not connected")
+        # Restored states / re-run automations often request the current state
+        if self._get_value(self) is on:
+            return
         try:
-            await self.hass.async_add_executor_job(self.coordinator.hub.publish_power, False)
+            await getattr(self.coordinator.hub, self._publish_attr)(on)
         except Exception as e:
             raise HomeAssistantError(str(e))
+        if self._evaluate_hvac_sync:
+            self._request_hvac_sync_evaluate()
 
 
-class FelshareFanSwitch(FelshareEntity, SwitchEntity):
-    _attr_has_entity_name = True
+class FelsharePowerSwitch(_FelshareDeviceSwitchBase):
+    _attr_name = "Power"
+    _attr_suggested_object_id = "power"
+    _attr_icon = "mdi:power"
+    _uid_suffix = "power"
+    _get_value = attrgetter("coordinator.data.power_on")
+    _publish_attr = "async_publish_power"
+
+
+class FelshareFanSwitch(_FelshareDeviceSwitchBase):
     _attr_name = "Fan"
     _attr_suggested_object_id = "fan"
     _attr_icon = "mdi:fan"
+    _uid_suffix = "fan"
+    _get_value = attrgetter("coordinator.data.fan_on")
+    _publish_attr = "async_publish_fan"
 
-    def __init__(self, coordinator: FelshareCoordinator, entry: ConfigEntry, dev: str) -> None:
-        super().__init__(coordinator, entry, dev)
-        self._attr_unique_id = f"{self._entry_id}_{dev}_fan"
-
-    @property
-    def is_on(self) -> bool | None:
-        return self.coordinator.data.fan_on
-
-    async def async_turn_on(self, **kwargs) -> None:
-        self._raise_if_hvac_sync_locked()
-        try:
-            await self.hass.async_add_executor_job(self.coordinator.hub.publish_fan, True)
-        except Exception as e:
-            raise HomeAssistantError(str(e))
 
-    async def async_turn_off(self, **kwargs) -> None:
-        self._raise_if_hvac_sync_locked()
-        try:
-            await self.hass.async_add_executor_job(self.coordinator.hub.publish_fan, False)
-        except Exception as e:
-            raise HomeAssistantError(str(e))
-
-
-class FelshareWorkEnabledSwitch(FelshareEntity, SwitchEntity):
+class FelshareWorkEnabledSwitch(_FelshareDeviceSwitchBase):
     """Enable/disable the programmed WorkTime schedule."""
 
-    _attr_has_entity_name = True
     _attr_name = "Work schedule"
     _attr_entity_category = None
     _attr_suggested_object_id = "00_work_schedule"
     _attr_icon = "mdi:calendar-clock"
-
-    def __init__(self, coordinator: FelshareCoordinator, entry: ConfigEntry, dev: str) -> None:
-        super().__init__(coordinator, entry, dev)
-        self._attr_unique_id = f"{self._entry_id}_{dev}_work_enabled"
-
-    @property
-    def is_on(self) -> bool | None:
-        return self.coordinator.data.work_enabled
-
-    async def async_turn_on(self, **kwargs) -> None:
-        self._raise_if_hvac_sync_locked()
-        try:
-            await self.hass.async_add_executor_job(self.coordinator.hub.publish_work_enabled, True)
-            ctl = self.hass.data.get(DOMAIN, {}).get(self._entry.entry_id, {}).get("hvac_sync")
-            if ctl is not None:
-                await ctl.async_evaluate(force=True)
-        except Exception as e:
-            raise HomeAssistantError(str(e))
-
-    async def async_turn_off(self, **kwargs) -> None:
-        self._raise_if_hvac_sync_locked()
-        try:
-            await self.hass.async_add_executor_job(self.coordinator.hub.publish_work_enabled, False)
-            ctl = self.hass.data.get(DOMAIN, {}).get(self._entry.entry_id, {}).get("hvac_sync")
-            if ctl is not None:
-                await ctl.async_evaluate(force=True)
-        except Exception as e:
-            raise HomeAssistantError(str(e))
+    _uid_suffix = "work_enabled"
+    _get_value = attrgetter("coordinator.data.work_enabled")
+    _publish_attr = "async_publish_work_enabled"
+    _evaluate_hvac_sync = True
 
 
 class FelshareWorkDaySwitch(FelshareEntity, SwitchEntity):
@@ -172,24 +140,27 @@ class FelshareWorkDaySwitch(FelshareEntity, SwitchEntity):
         entry: ConfigEntry,
         dev: str,
         *,
-        key: str,
-        label: str,
+        uid_suffix: str,
+        name: str,
         bit: int,
+        inv_bit: int,
+        object_id: str,
     ) -> None:
+        # Per-instance suffix, so FelshareEntity builds the unique_id like for every other entity
+        self._uid_suffix = uid_suffix
         super().__init__(coordinator, entry, dev)
-        self._key = key
         self._bit = bit
-        self._attr_name = f"Work day {label}"
-        self._attr_unique_id = f"{self._entry_id}_{dev}_work_day_{key}"
+        self._inv_bit = inv_bit
+        self._attr_name = name
         # Keep your sorting scheme
-        self._attr_suggested_object_id = f"05_work_day_{key}"
+        self._attr_suggested_object_id = object_id
 
     @property
     def is_on(self) -> bool | None:
         mask = self.coordinator.data.work_days_mask
         if mask is None:
             return None
-        return bool(mask & self._bit)
+        return (mask & self._bit) != 0
 
     async def async_turn_on(self, **kwargs) -> None:
         await self._async_set_day(True)
@@ -200,21 +171,18 @@ class FelshareWorkDaySwitch(FelshareEntity, SwitchEntity):
     async def _async_set_day(self, on: bool) -> None:
         self._raise_if_hvac_sync_locked()
         d = self.coordinator.data
-        mask = d.work_days_mask if d.work_days_mask is not None else 0x7F
-        if on:
-            mask |= self._bit
-        else:
-            mask &= ~self._bit
+        if not d.connected:
+            raise HomeAssistantError("MQTT not connected")
 
-        try:
-            await self.hass.async_add_executor_job(
-                functools.partial(self.coordinator.hub.publish_work_schedule, days_mask=mask)
-            )
-            ctl = self.hass.data.get(DOMAIN, {}).get(self._entry.entry_id, {}).get("hvac_sync")
-            if ctl is not None:
-                await ctl.async_evaluate(force=True)
-        except Exception as e:
-            raise HomeAssistantError(str(e))
+        mask = d.work_days_mask
+        if mask is not None and ((mask & self._bit) != 0) is on:
+            return
+
+        # Toggles are batched by the coordinator so a script flipping several days
+        # sends a single WorkTime frame. The batch's future raises (after rolling the
+        # toggles back) if that publish fails; shielded because other toggles share it.
+        await asyncio.shield(self.coordinator.async_queue_work_day(self._bit, self._inv_bit, on))
+        self._request_hvac_sync_evaluate()
 
 
 class FelshareHvacSyncEnabledSwitch(FelshareEntity, SwitchEntity):
@@ -225,10 +193,7 @@ class FelshareHvacSyncEnabledSwitch(FelshareEntity, SwitchEntity):
     _attr_entity_category = None
     _attr_suggested_object_id = "89_hvac_sync"
     _attr_icon = "mdi:hvac"
-
-    def __init__(self, coordinator: FelshareCoordinator, entry: ConfigEntry, dev: str) -> None:
-        super().__init__(coordinator, entry, dev)
-        self._attr_unique_id = f"{self._entry_id}_{dev}_hvac_sync_enabled"
+    _uid_suffix = "hvac_sync_enabled"
 
     @property
     def is_on(self) -> bool | None:
@@ -245,13 +210,11 @@ class FelshareHvacSyncEnabledSwitch(FelshareEntity, SwitchEntity):
         await self._async_set(False)
 
     async def _async_set(self, value: bool) -> None:
-        new_opts = dict(self._entry.options)
-        new_opts[CONF_HVAC_SYNC_ENABLED] = bool(value)
-        self.hass.config_entries.async_update_entry(self._entry, options=new_opts)
+        if bool(self._entry.options.get(CONF_HVAC_SYNC_ENABLED, DEFAULT_HVAC_SYNC_ENABLED)) == value:
+            return
+        self._update_entry(self._entry, options={**self._entry.options, CONF_HVAC_SYNC_ENABLED: bool(value)})
 
-        ctl = self.hass.data.get(DOMAIN, {}).get(self._entry.entry_id, {}).get("hvac_sync")
-        if ctl is not None:
-            await ctl.async_evaluate(force=True)
+        self._request_hvac_sync_evaluate()
         self.async_write_ha_state()
 
 
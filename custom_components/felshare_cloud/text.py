@@ -1,112 +1,99 @@
 from __future__ import annotations
 
+from operator import attrgetter
+import re
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.components.text import TextEntity, TextMode
 from homeassistant.exceptions import HomeAssistantError
 
-from .const import DOMAIN
 from .coordinator import FelshareCoordinator
 from .entity import FelshareEntity
 
 _HHMM_PATTERN = r"^([01]\d|2[0-3]):[0-5]\d$"
+_HHMM_RE = re.compile(_HHMM_PATTERN)
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback) -> None:
-    coordinator: FelshareCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    coordinator: FelshareCoordinator = entry.runtime_data.coordinator
     dev = coordinator.data.device_id
 
     async_add_entities(
-        [
+        (
             FelshareOilNameText(coordinator, entry, dev),
             FelshareWorkStartText(coordinator, entry, dev),
             FelshareWorkEndText(coordinator, entry, dev),
-        ]
+        ),
+        update_before_add=False,
     )
 
 
-class FelshareOilNameText(FelshareEntity, TextEntity):
+class _FelshareTextBase(FelshareEntity, TextEntity):
+    """Shared write path: lock check, optional validation, publish, HVAC Sync poke."""
+
     _attr_has_entity_name = True
-    _attr_name = "Oil name"
     _attr_entity_category = None
-    _attr_suggested_object_id = "oil_name"
-    _attr_icon = "mdi:flower"
     _attr_mode = TextMode.TEXT
-    _attr_native_min = 0
-    _attr_native_max = 10
-
-    def __init__(self, coordinator: FelshareCoordinator, entry: ConfigEntry, dev: str) -> None:
-        super().__init__(coordinator, entry, dev)
-        self._attr_unique_id = f"{self._entry_id}_{dev}_oil_name"
+    _get_value: attrgetter
+    _publish_attr: str
+    _value_re: re.Pattern[str] | None = None
+    # Work start/end also define HVAC Sync's schedule window
+    _evaluate_hvac_sync = False
 
     @property
     def native_value(self):
-        return self.coordinator.data.oil_name
+        return self._get_value(self)
 
     async def async_set_value(self, value: str) -> None:
         self._raise_if_hvac_sync_locked()
+        if self._value_re is not None and not self._value_re.match(value):
+            raise HomeAssistantError("Invalid HH:MM")
+        if self.coordinator.data.connected and self._get_value(self) == value:
+            # Already reported by the (connected) device: nothing to send. Offline writes
+            # still take the publish path and its error.
+            return
         try:
-            await self.hass.async_add_executor_job(self.coordinator.hub.publish_oil_name, value)
+            await getattr(self.coordinator.hub, self._publish_attr)(value)
         except Exception as e:
             raise HomeAssistantError(str(e))
+        if self._evaluate_hvac_sync:
+            self._request_hvac_sync_evaluate()
 
 
-class FelshareWorkStartText(FelshareEntity, TextEntity):
-    _attr_has_entity_name = True
-    _attr_name = "Work start (HH:MM)"
-    _attr_entity_category = None
-    _attr_suggested_object_id = "01_work_start"
-    _attr_icon = "mdi:clock-start"
-    _attr_mode = TextMode.TEXT
+class FelshareOilNameText(_FelshareTextBase):
+    _attr_name = "Oil name"
+    _attr_suggested_object_id = "oil_name"
+    _attr_icon = "mdi:flower"
+    _attr_native_min = 0
+    _attr_native_max = 10
+    _uid_suffix = "oil_name"
+    _get_value = attrgetter("coordinator.data.oil_name")
+    _publish_attr = "async_publish_oil_name"
+
+
+class _FelshareWorkTimeTextBase(_FelshareTextBase):
     _attr_pattern = _HHMM_PATTERN
     _attr_native_min = 5
     _attr_native_max = 5
+    _value_re = _HHMM_RE
+    _evaluate_hvac_sync = True
 
-    def __init__(self, coordinator: FelshareCoordinator, entry: ConfigEntry, dev: str) -> None:
-        super().__init__(coordinator, entry, dev)
-        self._attr_unique_id = f"{self._entry_id}_{dev}_work_start"
-
-    @property
-    def native_value(self):
-        return self.coordinator.data.work_start
 
-    async def async_set_value(self, value: str) -> None:
-        self._raise_if_hvac_sync_locked()
-        try:
-            await self.hass.async_add_executor_job(self.coordinator.hub.publish_work_start, value)
-            ctl = self.hass.data.get(DOMAIN, {}).get(self._entry.entry_id, {}).get("hvac_sync")
-            if ctl is not None:
-                await ctl.async_evaluate(force=True)
-        except Exception as e:
-            raise HomeAssistantError(str(e))
+class FelshareWorkStartText(_FelshareWorkTimeTextBase):
+    _attr_name = "Work start (HH:MM)"
+    _attr_suggested_object_id = "01_work_start"
+    _attr_icon = "mdi:clock-start"
+    _uid_suffix = "work_start"
+    _get_value = attrgetter("coordinator.data.work_start")
+    _publish_attr = "async_publish_work_start"
 
 
-class FelshareWorkEndText(FelshareEntity, TextEntity):
-    _attr_has_entity_name = True
+class FelshareWorkEndText(_FelshareWorkTimeTextBase):
     _attr_name = "Work end (HH:MM)"
-    _attr_entity_category = None
     _attr_suggested_object_id = "02_work_end"
     _attr_icon = "mdi:clock-end"
-    _attr_mode = TextMode.TEXT
-    _attr_pattern = _HHMM_PATTERN
-    _attr_native_min = 5
-    _attr_native_max = 5
-
-    def __init__(self, coordinator: FelshareCoordinator, entry: ConfigEntry, dev: str) -> None:
-        super().__init__(coordinator, entry, dev)
-        self._attr_unique_id = f"{self._entry_id}_{dev}_work_end"
-
-    @property
-    def native_value(self):
-        return self.coordinator.data.work_end
-
-    async def async_set_value(self, value: str) -> None:
-        self._raise_if_hvac_sync_locked()
-        try:
-            await self.hass.async_add_executor_job(self.coordinator.hub.publish_work_end, value)
-            ctl = self.hass.data.get(DOMAIN, {}).get(self._entry.entry_id, {}).get("hvac_sync")
-            if ctl is not None:
-                await ctl.async_evaluate(force=True)
-        except Exception as e:
-            raise HomeAssistantError(str(e))
+    _uid_suffix = "work_end"
+    _get_value = attrgetter("coordinator.data.work_end")
+    _publish_attr = "async_publish_work_end"